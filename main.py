@@ -1,17 +1,23 @@
+import asyncio
 import json
 import os
 
 import uvicorn
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import Response
+from fastapi.responses import JSONResponse, Response
 from fastapi.templating import Jinja2Templates
+from starlette.concurrency import run_in_threadpool
 
 from utils.create_containers import Azure_Container
-from utils.read_params import read_params
+from utils.job_manager import Job_Rejected, get_job_manager
+from utils.read_params import read_params, reload_params
+from wafer.blob_storage_operations.blob_cache import get_blob_cache
 from wafer.model.load_production_model import Load_Prod_Model
+from wafer.model.online_prediction import get_online_prediction
 from wafer.model.prediction_from_model import Prediction
 from wafer.model.training_model import Train_Model
+from wafer.mongo_db_operations.mongo_client import mongo_client_registry
 from wafer.validation_insertion.prediction_validation_insertion import Pred_Validation
 from wafer.validation_insertion.train_validation_insertion import Train_Validation
 
@@ -55,54 +61,160 @@ async def create_containers():
         return Response(f"Error Occurred : {e}")
 
 
-@app.get("/train")
-async def trainRouteClient():
-    try:
-        raw_data_train_container_name = config["container"]["raw_data"]
+def training_job(report):
+    raw_data_train_container_name = config["container"]["raw_data"]
+
+    report("validation")
+
+    azure_container = Azure_Container()
+
+    azure_container.generate_containers()
+
+    train_val = Train_Validation(container_name=raw_data_train_container_name)
+
+    train_val.training_validation()
+
+    report("training")
+
+    train_model = Train_Model()
+
+    num_clusters = train_model.training_model()
+
+    report("promotion")
+
+    load_prod_model = Load_Prod_Model(num_clusters=num_clusters)
 
-        azure_container = Azure_Container()
+    load_prod_model.load_production_model()
 
-        azure_container.generate_containers()
+    return "Training successfull!!"
 
-        train_val = Train_Validation(container_name=raw_data_train_container_name)
 
-        train_val.training_validation()
+def prediction_job(report):
+    raw_data_pred_container_name = config["container"]["raw_data"]
 
-        train_model = Train_Model()
+    report("validation")
 
-        num_clusters = train_model.training_model()
+    pred_val = Pred_Validation(raw_data_pred_container_name)
 
-        load_prod_model = Load_Prod_Model(num_clusters=num_clusters)
+    pred_val.prediction_validation()
 
-        load_prod_model.load_production_model()
+    report("prediction")
 
-        return Response("Training successfull!!")
+    pred = Prediction()
+
+    container, filename, json_predictions = pred.predict_from_model()
+
+    return {
+        "container": container,
+        "filename": filename,
+        "predictions": json.loads(json_predictions),
+    }
+
+
+def submit_job(kind, func, stages):
+    try:
+        job_id = get_job_manager(config["jobs"]).submit(
+            kind=kind, func=func, stages=stages
+        )
+
+        return JSONResponse(
+            {"job_id": job_id, "status_url": f"/jobs/{job_id}"}, status_code=202
+        )
+
+    except Job_Rejected as e:
+        return JSONResponse({"error": str(e)}, status_code=409)
 
     except Exception as e:
         return Response(f"Error Occurred : {e}")
 
 
+@app.get("/train")
+async def trainRouteClient():
+    return submit_job(
+        kind="train",
+        func=training_job,
+        stages=["validation", "training", "promotion"],
+    )
+
+
 @app.get("/predict")
 async def predictRouteClient():
+    return submit_job(
+        kind="predict", func=prediction_job, stages=["validation", "prediction"]
+    )
+
+
+@app.post("/predict/online")
+async def onlinePredictRouteClient(request: Request):
     try:
-        raw_data_pred_container_name = config["container"]["raw_data"]
+        online_pred = await run_in_threadpool(get_online_prediction)
 
-        pred_val = Pred_Validation(raw_data_pred_container_name)
+        body = await request.body()
 
-        pred_val.prediction_validation()
+        data = await run_in_threadpool(
+            online_pred.get_dataframe,
+            body=body,
+            content_type=request.headers.get("content-type", ""),
+        )
 
-        pred = Prediction()
+        future = await run_in_threadpool(online_pred.predict, data)
 
-        container, filename, json_predictions = pred.predict_from_model()
+        predictions = (await asyncio.wrap_future(future)).tolist()
 
-        return Response(
-            f"Prediction file created in {container} container with filename as {filename}, and few of the predictions are {str(json.loads(json_predictions))}"
+        func = (
+            lambda: [
+                {"Wafer": wafer, "Prediction": pred}
+                for wafer, pred in zip(data["Wafer"].tolist(), predictions)
+            ]
+            if "Wafer" in data.columns
+            else [{"Prediction": pred} for pred in predictions]
         )
 
+        return {"predictions": func()}
+
+    except ValueError as e:
+        return JSONResponse({"error": str(e)}, status_code=422)
+
     except Exception as e:
         return Response(f"Error Occurred! {e}")
 
 
+@app.get("/jobs/{job_id}")
+async def job_status(job_id: str):
+    job = get_job_manager(config["jobs"]).get_job(job_id)
+
+    if job is None:
+        return JSONResponse({"error": f"{job_id} job is not found"}, status_code=404)
+
+    return job
+
+
+@app.post("/reload")
+async def reload_config():
+    global config
+
+    try:
+        config = reload_params()
+
+        return Response("Reloaded params.yaml !!")
+
+    except Exception as e:
+        return Response(f"Error Occurred : {e}")
+
+
+@app.get("/stats/mongodb")
+async def mongodb_stats():
+    return mongo_client_registry.get_pool_stats()
+
+
+@app.get("/stats/blob_cache")
+async def blob_cache_stats():
+    if config["blob"]["cache"]["enabled"] is not True:
+        return {"enabled": False}
+
+    return dict(get_blob_cache(config["blob"]["cache"]).get_stats(), enabled=True)
+
+
 if __name__ == "__main__":
     host = config["app"]["host"]
 
@@ -0,0 +1,146 @@
+"""
+Description :   This script is used for comparing the imputer strategies of params.yaml on synthetic wafer data,
+                reporting the fit and transform wall time, the peak traced memory and the auc of a random forest
+                trained on the imputed data. Run from the repo root with
+
+                    python -m scripts.imputation_benchmark --rows 20000 --strategies knn chunked_knn median
+
+Version     :   1.2
+Revisions   :   moved to setup to cloud
+"""
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.metrics import roc_auc_score
+from sklearn.model_selection import train_test_split
+from utils.read_params import read_params
+from wafer.data_preprocessing.imputation import get_imputer
+
+
+def get_wafer_data(rows, cols, missing_rate, seed):
+    """
+    Method Name :   get_wafer_data
+    Description :   This method is used for generating sensor readings driven by a few latent process factors,
+                    with a rare fault label and missing values, part at random and part in sensors which drop
+                    out together
+    Output      :   The features with nan and the labels
+
+    Version     :   1.2
+    Revisions   :   moved setup to cloud
+    """
+    rng = np.random.RandomState(seed)
+
+    factors = rng.normal(size=(rows, 10))
+
+    X = factors @ rng.normal(size=(10, cols)) + rng.normal(scale=0.5, size=(rows, cols))
+
+    score = factors[:, 0] + 0.5 * factors[:, 1] * factors[:, 2]
+
+    y = (score > np.quantile(score, 0.93)).astype(int)
+
+    mask = rng.rand(rows, cols) < missing_rate
+
+    dropout_cols = rng.choice(cols, max(1, cols // 20), replace=False)
+
+    mask[np.ix_(rng.rand(rows) < 0.1, dropout_cols)] = True
+
+    X[mask] = np.nan
+
+    return X, y
+
+
+def run_strategy(imputer_config, strategy, X_train, X_test, y_train, y_test, seed):
+    """
+    Method Name :   run_strategy
+    Description :   This method is used for fitting the imputer of strategy on the train data, imputing both the
+                    train and test data and scoring a random forest trained on the imputed train data
+    Output      :   A dict with the timings, the peak memory and the auc
+
+    Version     :   1.2
+    Revisions   :   moved setup to cloud
+    """
+    imputer = get_imputer(dict(imputer_config, strategy=strategy))
+
+    tracemalloc.start()
+
+    start = time.perf_counter()
+
+    imputer.fit(X_train)
+
+    fit_secs = time.perf_counter() - start
+
+    start = time.perf_counter()
+
+    X_train_imputed = imputer.transform(X_train)
+
+    X_test_imputed = imputer.transform(X_test)
+
+    transform_secs = time.perf_counter() - start
+
+    _, peak = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+
+    model = RandomForestClassifier(n_estimators=200, n_jobs=-1, random_state=seed)
+
+    model.fit(X_train_imputed, y_train)
+
+    auc = roc_auc_score(y_test, model.predict_proba(X_test_imputed)[:, 1])
+
+    return {
+        "strategy": strategy,
+        "fit_secs": fit_secs,
+        "transform_secs": transform_secs,
+        "peak_mb": peak / 2**20,
+        "auc": auc,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the imputer strategies")
+
+    parser.add_argument("--rows", type=int, default=10000)
+
+    parser.add_argument("--cols", type=int, default=590)
+
+    parser.add_argument("--missing-rate", type=float, default=0.05)
+
+    parser.add_argument(
+        "--strategies", nargs="+", default=["knn", "chunked_knn", "median", "iterative"]
+    )
+
+    parser.add_argument("--seed", type=int, default=42)
+
+    args = parser.parse_args()
+
+    imputer_config = read_params()["imputer"]
+
+    X, y = get_wafer_data(args.rows, args.cols, args.missing_rate, args.seed)
+
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=0.3, stratify=y, random_state=args.seed
+    )
+
+    print(
+        f"{args.rows} rows x {args.cols} cols, {np.isnan(X).mean():.2%} missing, {y.mean():.2%} faulty"
+    )
+
+    print(
+        f"{'strategy':<12} {'fit secs':>10} {'transform secs':>15} {'peak mb':>10} {'auc':>8}"
+    )
+
+    for strategy in args.strategies:
+        result = run_strategy(
+            imputer_config, strategy, X_train, X_test, y_train, y_test, args.seed
+        )
+
+        print(
+            f"{result['strategy']:<12} {result['fit_secs']:>10.2f} {result['transform_secs']:>15.2f} {result['peak_mb']:>10.1f} {result['auc']:>8.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,4 @@
-import os
-
-from wafer.blob_storage_operations.blob_operations import Blob_Operation
+from wafer.blob_storage_operations.storage_operations import get_storage_operation
 
 from utils.logger import App_Logger
 from utils.read_params import read_params
@@ -10,11 +8,9 @@ class Azure_Container:
     def __init__(self):
         self.config = read_params()
 
-        self.connection_string = os.environ["AZURE_CONN_STR"]
-
         self.containers = list(self.config["container"].values())
 
-        self.blob = Blob_Operation()
+        self.blob = get_storage_operation()
 
         self.class_name = self.__class__.__name__
 
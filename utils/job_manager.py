@@ -0,0 +1,257 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+
+class Job_Rejected(Exception):
+    """
+    Description :   This exception is raised when a job is submitted while another job of the same kind
+                    is active and the concurrency of the kind is set to reject
+
+    Version     :   1.2
+    Revisions   :   moved setup to cloud
+    """
+
+
+class Job_Manager:
+    """
+    Description :   This class is used for running the blocking pipelines in a worker pool, so that the
+                    api can return a job id at once. Every job keeps its status, the stage it is in, the
+                    progress over its stages and the time taken by each stage. The concurrency of each
+                    kind of job is one of parallel, serialize or reject
+
+    Version     :   1.2
+    Revisions   :   moved setup to cloud
+    """
+
+    def __init__(self, max_workers, max_finished_jobs, concurrency):
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="job"
+        )
+
+        self.max_finished_jobs = max_finished_jobs
+
+        self.concurrency = concurrency
+
+        self.jobs = OrderedDict()
+
+        self.lock = threading.Lock()
+
+        self.pending = {}
+
+        self.busy_kinds = set()
+
+        self.stage_starts = {}
+
+    def get_active_jobs(self, kind):
+        return [
+            job_id
+            for job_id, job in self.jobs.items()
+            if job["kind"] == kind and job["status"] in ("queued", "running")
+        ]
+
+    def submit(self, kind, func, stages):
+        """
+        Method Name :   submit
+        Description :   This method is used for submitting func as a job of the kind, func is called with a
+                        report function which is called with the name of each stage as it starts
+        Output      :   The job id
+        On failure  :   Raise Job_Rejected
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        mode = self.concurrency.get(kind, "parallel")
+
+        with self.lock:
+            active = self.get_active_jobs(kind)
+
+            if mode == "reject" and len(active) > 0:
+                raise Job_Rejected(
+                    f"{kind} job {active[0]} is already {self.jobs[active[0]]['status']}"
+                )
+
+            job_id = uuid.uuid4().hex
+
+            self.jobs[job_id] = {
+                "id": job_id,
+                "kind": kind,
+                "status": "queued",
+                "stage": None,
+                "progress": 0.0,
+                "stages": OrderedDict((stage, None) for stage in stages),
+                "submitted_at": datetime.utcnow().isoformat(),
+                "started_at": None,
+                "finished_at": None,
+                "secs": None,
+                "result": None,
+                "error": None,
+            }
+
+            self.remove_finished_jobs()
+
+            serialize = mode == "serialize"
+
+            if serialize and kind in self.busy_kinds:
+                self.pending.setdefault(kind, deque()).append((job_id, func))
+
+                return job_id
+
+            if serialize:
+                self.busy_kinds.add(kind)
+
+        self.dispatch(kind, job_id, func, serialize)
+
+        return job_id
+
+    def dispatch(self, kind, job_id, func, serialize):
+        """
+        Method Name :   dispatch
+        Description :   This method is used for handing the job to the worker pool, for a serialized kind the
+                        next pending job is dispatched when this one is done, so that a waiting job never holds
+                        a worker
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        future = self.executor.submit(self.run, job_id, func)
+
+        if serialize:
+            future.add_done_callback(lambda _: self.dispatch_next(kind))
+
+    def dispatch_next(self, kind):
+        with self.lock:
+            pending = self.pending.get(kind)
+
+            if not pending:
+                self.busy_kinds.discard(kind)
+
+                return
+
+            job_id, func = pending.popleft()
+
+        self.dispatch(kind, job_id, func, serialize=True)
+
+    def run(self, job_id, func):
+        """
+        Method Name :   run
+        Description :   This method is used for running the job in the worker thread
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        start = time.perf_counter()
+
+        self.update(job_id, status="running", started_at=datetime.utcnow().isoformat())
+
+        try:
+            result = func(lambda stage: self.set_stage(job_id, stage))
+
+            outcome = {"status": "succeeded", "progress": 1.0, "result": result}
+
+        except Exception as e:
+            outcome = {"status": "failed", "error": str(e)}
+
+        self.set_stage(job_id, None)
+
+        self.update(
+            job_id,
+            finished_at=datetime.utcnow().isoformat(),
+            secs=time.perf_counter() - start,
+            **outcome,
+        )
+
+    def set_stage(self, job_id, stage):
+        """
+        Method Name :   set_stage
+        Description :   This method is used for recording the time taken by the current stage of the job and
+                        moving it to the next stage, stage is None once the job is over
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        now = time.perf_counter()
+
+        with self.lock:
+            job = self.jobs[job_id]
+
+            if job_id in self.stage_starts:
+                job["stages"][job["stage"]] = now - self.stage_starts.pop(job_id)
+
+            if stage is not None:
+                job["stage"] = stage
+
+                job["progress"] = list(job["stages"]).index(stage) / len(job["stages"])
+
+                self.stage_starts[job_id] = now
+
+    def update(self, job_id, **kwargs):
+        """
+        Method Name :   update
+        Description :   This method is used for updating the fields of the job, the final status is set together
+                        with finished_at and secs so that a finished job is only evicted once complete. Ids which
+                        were already evicted are ignored
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        with self.lock:
+            job = self.jobs.get(job_id)
+
+            if job is not None:
+                job.update(kwargs)
+
+    def remove_finished_jobs(self):
+        finished = [
+            job_id
+            for job_id, job in self.jobs.items()
+            if job["status"] in ("succeeded", "failed")
+        ]
+
+        for job_id in finished[: max(len(finished) - self.max_finished_jobs, 0)]:
+            self.jobs.pop(job_id)
+
+    def get_job(self, job_id):
+        """
+        Method Name :   get_job
+        Description :   This method is used for getting a copy of the job status, None if the job id is unknown
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        with self.lock:
+            job = self.jobs.get(job_id)
+
+            if job is None:
+                return None
+
+            return dict(job, stages=dict(job["stages"]))
+
+
+_job_manager = None
+
+_job_manager_lock = threading.Lock()
+
+
+def get_job_manager(jobs_config):
+    """
+    Method Name :   get_job_manager
+    Description :   This method is used for getting the process wide job manager, which is created on first use
+
+    Version     :   1.2
+    Revisions   :   moved setup to cloud
+    """
+    global _job_manager
+
+    with _job_manager_lock:
+        if _job_manager is None:
+            _job_manager = Job_Manager(
+                max_workers=jobs_config["max_workers"],
+                max_finished_jobs=jobs_config["max_finished_jobs"],
+                concurrency=jobs_config["concurrency"],
+            )
+
+        return _job_manager
@@ -1,13 +1,275 @@
+import atexit
+import queue
+import threading
 from datetime import datetime
+
+from pymongo.errors import BulkWriteError
+from utils.read_params import read_params
 from wafer.mongo_db_operations.mongo_operations import MongoDB_Operation
 
 
+class Log_Buffer:
+    """
+    Description :   This class is used for queueing the log records in memory and flushing them to
+                    MongoDB with insert_many from a background thread, based on size and time thresholds
+
+    Version     :   1.2
+    Revisions   :   moved setup to cloud
+    """
+
+    def __init__(
+        self, mongo, max_batch_size, flush_interval, max_retries, max_queued_records
+    ):
+        self.mongo = mongo
+
+        self.max_retries = max_retries
+
+        self.max_queued_records = max_queued_records
+
+        self.max_batch_size = max_batch_size
+
+        self.flush_interval = flush_interval
+
+        self.records = queue.Queue()
+
+        self.flush_lock = threading.Lock()
+
+        self.wake_event = threading.Event()
+
+        self.error = None
+
+        self.failed_records = 0
+
+        self.dropped_records = 0
+
+        self.thread = threading.Thread(
+            target=self.run, name="log-buffer-flush", daemon=True
+        )
+
+        self.thread.start()
+
+        atexit.register(self.flush)
+
+    def put(self, db_name, collection_name, record):
+        """
+        Method Name :   put
+        Description :   This method is used for queueing a log record, the flush thread is woken up
+                        once the queue reaches the max batch size
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        self.records.put((db_name, collection_name, record, 0))
+
+        if self.records.qsize() >= self.max_batch_size:
+            self.wake_event.set()
+
+    def run(self):
+        """
+        Method Name :   run
+        Description :   This method is the background loop, which flushes the queued records every
+                        flush interval or when woken up by put. Errors are kept and raised on the next
+                        explicit flush, since there is no caller to raise them to here
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        while True:
+            self.wake_event.wait(timeout=self.flush_interval)
+
+            self.wake_event.clear()
+
+            try:
+                self.write_records()
+
+            except Exception as e:
+                self.error = e
+
+    def get_unwritten_records(self, batch, error):
+        """
+        Method Name :   get_unwritten_records
+        Description :   This method is used for getting the records of a failed insert_many which were not
+                        written. For a bulk write error these are the write errors other than duplicate keys,
+                        their _id stamped by insert_many is removed. For any other error the whole batch is
+                        returned with its _id kept, so that records which did reach the database fail as
+                        duplicate keys on the retry instead of being written twice
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        if not isinstance(error, BulkWriteError):
+            return batch
+
+        indices = sorted(
+            {
+                write_error["index"]
+                for write_error in error.details.get("writeErrors", [])
+                if write_error.get("code") != 11000
+            }
+        )
+
+        for i in indices:
+            batch[i][0].pop("_id", None)
+
+        return [batch[i] for i in indices]
+
+    def requeue_records(self, db_name, collection_name, items):
+        """
+        Method Name :   requeue_records
+        Description :   This method is used for putting the unwritten records back on the queue, a record is
+                        dropped once it has been retried max_retries times or when the queue already holds
+                        max_queued_records records, so that an outage can not grow the memory without bound
+        Output      :   The number of records queued again and the number dropped
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        requeued, dropped = 0, 0
+
+        for record, attempts in items:
+            if (
+                attempts >= self.max_retries
+                or self.records.qsize() >= self.max_queued_records
+            ):
+                dropped += 1
+
+                continue
+
+            self.records.put((db_name, collection_name, record, attempts + 1))
+
+            requeued += 1
+
+        self.dropped_records += dropped
+
+        return requeued, dropped
+
+    def write_records(self):
+        """
+        Method Name :   write_records
+        Description :   This method is used for draining the queue and inserting the records with one
+                        insert_many per db and collection. The records of a failed insert_many which were not
+                        written are put back on the queue for the next flush
+        On failure  :   Raise Exception with the number of records queued again and dropped
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        with self.flush_lock:
+            batches = {}
+
+            while True:
+                try:
+                    (
+                        db_name,
+                        collection_name,
+                        record,
+                        attempts,
+                    ) = self.records.get_nowait()
+
+                except queue.Empty:
+                    break
+
+                batches.setdefault((db_name, collection_name), []).append(
+                    (record, attempts)
+                )
+
+            requeued, dropped, error = 0, 0, None
+
+            for (db_name, collection_name), items in batches.items():
+                for i in range(0, len(items), self.max_batch_size):
+                    batch = items[i : i + self.max_batch_size]
+
+                    try:
+                        self.mongo.insert_records(
+                            db_name=db_name,
+                            collection_name=collection_name,
+                            data=[record for record, _ in batch],
+                        )
+
+                    except Exception as e:
+                        error = e
+
+                        counts = self.requeue_records(
+                            db_name=db_name,
+                            collection_name=collection_name,
+                            items=self.get_unwritten_records(batch, e),
+                        )
+
+                        requeued, dropped = requeued + counts[0], dropped + counts[1]
+
+            if error is not None and requeued + dropped > 0:
+                self.failed_records += requeued + dropped
+
+                raise Exception(
+                    f"Failed to write {requeued + dropped} log records, {requeued} are queued again for the next flush and {dropped} are dropped : {error}"
+                ) from error
+
+    def flush(self):
+        """
+        Method Name :   flush
+        Description :   This method is used for writing all the queued records synchronously, and raising
+                        the error of a failed background flush if any
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        self.write_records()
+
+        if self.error is not None:
+            error, self.error = self.error, None
+
+            raise error
+
+
+_log_buffer = None
+
+_log_buffer_lock = threading.Lock()
+
+
+def get_log_buffer(
+    mongo, max_batch_size, flush_interval, max_retries, max_queued_records
+):
+    """
+    Method Name :   get_log_buffer
+    Description :   This method is used for getting the process wide log buffer, which is created on first use
+
+    Version     :   1.2
+    Revisions   :   moved setup to cloud
+    """
+    global _log_buffer
+
+    with _log_buffer_lock:
+        if _log_buffer is None:
+            _log_buffer = Log_Buffer(
+                mongo=mongo,
+                max_batch_size=max_batch_size,
+                flush_interval=flush_interval,
+                max_retries=max_retries,
+                max_queued_records=max_queued_records,
+            )
+
+        return _log_buffer
+
+
 class App_Logger:
     def __init__(self):
+        self.config = read_params()
+
         self.mongo = MongoDB_Operation()
 
         self.class_name = self.__class__.__name__
 
+        self.buffer = None
+
+        if self.config["log_buffer"]["enabled"] is True:
+            self.buffer = get_log_buffer(
+                mongo=self.mongo,
+                max_batch_size=self.config["log_buffer"]["max_batch_size"],
+                flush_interval=self.config["log_buffer"]["flush_interval"],
+                max_retries=self.config["log_buffer"]["max_retries"],
+                max_queued_records=self.config["log_buffer"]["max_queued_records"],
+            )
+
     def log(self, db_name, collection_name, log_info):
         try:
             log = {
@@ -16,13 +278,29 @@ class App_Logger:
                 "Log_Info": log_info,
             }
 
-            self.mongo.insert_record(
-                db_name=db_name, collection_name=collection_name, data=log
-            )
+            if self.buffer is not None:
+                self.buffer.put(
+                    db_name=db_name, collection_name=collection_name, record=log
+                )
+
+            else:
+                self.mongo.insert_record(
+                    db_name=db_name, collection_name=collection_name, data=log
+                )
 
         except Exception as e:
             raise e
 
+    def flush(self):
+        """
+        Method Name :   flush
+        Description :   This method is used for writing the buffered log records to MongoDB
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        if self.buffer is not None:
+            self.buffer.flush()
+
     def start_log(self, key, class_name, method_name, db_name, collection_name):
         """
         Method Name :   start_log
@@ -68,4 +346,8 @@ class App_Logger:
             db_name=db_name, collection_name=collection_name, log_info=exception_msg
         )
 
-        raise Exception(exception_msg)
+        try:
+            self.flush()
+
+        finally:
+            raise Exception(exception_msg)
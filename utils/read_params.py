@@ -1,10 +1,38 @@
+import hashlib
+import os
+import threading
+from types import MappingProxyType
+
 import yaml
 
+_params_cache = {}
+
+_params_lock = threading.Lock()
+
+
+def freeze_params(obj):
+    """
+    Method Name :   freeze_params
+    Description :   This method is used for converting the parsed yaml into a read only view, dicts
+                    become mapping proxies and lists become tuples
+
+    Version     :   1.2
+    Revisions   :   Moved to setup to cloud
+    """
+    if isinstance(obj, dict):
+        return MappingProxyType({k: freeze_params(v) for k, v in obj.items()})
+
+    if isinstance(obj, list):
+        return tuple(freeze_params(v) for v in obj)
+
+    return obj
+
 
 def read_params(config_path="params.yaml"):
     """
     Method Name :   read_params
-    Description :   This method is used for read the params from yaml file
+    Description :   This method is used for read the params from yaml file. The file is parsed once per
+                    process and re-parsed only when its mtime and content hash change
 
     Version     :   1.2
     Revisions   :   Moved to setup to cloud
@@ -14,12 +42,46 @@ def read_params(config_path="params.yaml"):
     file_name = __file__
 
     try:
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
+        path = os.path.abspath(config_path)
+
+        mtime = os.stat(path).st_mtime_ns
+
+        with _params_lock:
+            cached = _params_cache.get(path)
 
-        return config
+            if cached is None or cached["mtime"] != mtime:
+                with open(path, "rb") as f:
+                    content = f.read()
+
+                digest = hashlib.sha256(content).hexdigest()
+
+                if cached is None or cached["hash"] != digest:
+                    config = freeze_params(yaml.safe_load(content))
+
+                else:
+                    config = cached["config"]
+
+                cached = {"mtime": mtime, "hash": digest, "config": config}
+
+                _params_cache[path] = cached
+
+            return cached["config"]
 
     except Exception as e:
         raise Exception(
             f"Exception occured in {file_name}, Method : {method_name}, Error : {str(e)}"
         )
+
+
+def reload_params(config_path="params.yaml"):
+    """
+    Method Name :   reload_params
+    Description :   This method is used for dropping the cached params and parsing the yaml file again
+
+    Version     :   1.2
+    Revisions   :   Moved to setup to cloud
+    """
+    with _params_lock:
+        _params_cache.pop(os.path.abspath(config_path), None)
+
+    return read_params(config_path)
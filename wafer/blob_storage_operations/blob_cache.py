@@ -0,0 +1,279 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+
+class Cached_Object:
+    """
+    Description :   This class is used for wrapping the cached content of a blob, so that it can be read
+                    like the downloader object returned by the blob container
+
+    Version     :   1.2
+    Revisions   :   moved to setup to cloud
+    """
+
+    def __init__(self, content):
+        self.content = content
+
+        self.size = len(content)
+
+    def readall(self):
+        return self.content
+
+
+class Blob_Cache:
+    """
+    Description :   This class is used for caching blob contents on local disk and in memory, keyed by
+                    container/blob and validated with the blob etag. Contents are stored by their sha256 digest,
+                    so the same artifact in different blobs is kept once. Both tiers are evicted in least
+                    recently used order within their byte budgets
+
+    Version     :   1.2
+    Revisions   :   moved to setup to cloud
+    """
+
+    def __init__(self, cache_dir, max_memory_bytes, max_disk_bytes):
+        self.cache_dir = cache_dir
+
+        self.max_memory_bytes = max_memory_bytes
+
+        self.max_disk_bytes = max_disk_bytes
+
+        self.lock = threading.Lock()
+
+        self.memory = OrderedDict()
+
+        self.memory_bytes = 0
+
+        self.hits = 0
+
+        self.misses = 0
+
+        self.index_file = os.path.join(self.cache_dir, "index.json")
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        self.index = self.load_index()
+
+        self.disk_bytes = sum(
+            entry["size"] for entry in self.unique_entries(self.index.values())
+        )
+
+    def load_index(self):
+        try:
+            with open(self.index_file) as f:
+                entries = json.load(f)
+
+        except (OSError, ValueError):
+            entries = []
+
+        return OrderedDict(
+            (entry["key"], entry)
+            for entry in entries
+            if os.path.isfile(self.get_path(entry["digest"]))
+        )
+
+    def save_index(self):
+        with tempfile.NamedTemporaryFile(
+            mode="w", dir=self.cache_dir, delete=False
+        ) as f:
+            json.dump(list(self.index.values()), f)
+
+        os.replace(f.name, self.index_file)
+
+    def unique_entries(self, entries):
+        seen = set()
+
+        for entry in entries:
+            if entry["digest"] not in seen:
+                seen.add(entry["digest"])
+
+                yield entry
+
+    def get_path(self, digest):
+        return os.path.join(self.cache_dir, digest[:2], digest)
+
+    def get_etag(self, key):
+        """
+        Method Name :   get_etag
+        Description :   This method is used for getting the etag of the cached content for the key, None if
+                        the key is not cached
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        with self.lock:
+            entry = self.index.get(key)
+
+            return None if entry is None else entry["etag"]
+
+    def get(self, key):
+        """
+        Method Name :   get
+        Description :   This method is used for reading the cached content for the key after the etag was
+                        revalidated, from memory if present or else from disk
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        with self.lock:
+            entry = self.index.get(key)
+
+            if entry is None:
+                return None
+
+            digest = entry["digest"]
+
+            self.index.move_to_end(key)
+
+            if digest in self.memory:
+                self.memory.move_to_end(digest)
+
+                self.hits += 1
+
+                return self.memory[digest]
+
+            try:
+                with open(self.get_path(digest), "rb") as f:
+                    content = f.read()
+
+            except OSError:
+                self.index.pop(key)
+
+                return None
+
+            self.put_memory(digest, content)
+
+            self.hits += 1
+
+            return content
+
+    def put(self, key, etag, content):
+        """
+        Method Name :   put
+        Description :   This method is used for storing the downloaded content with its etag, every put is
+                        counted as a miss since the content had to be downloaded
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        digest = hashlib.sha256(content).hexdigest()
+
+        with self.lock:
+            self.misses += 1
+
+            if len(content) > self.max_disk_bytes:
+                return
+
+            old = self.index.pop(key, None)
+
+            if old is not None:
+                self.release(old["digest"])
+
+            path = self.get_path(digest)
+
+            if not os.path.isfile(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+
+                with tempfile.NamedTemporaryFile(
+                    dir=os.path.dirname(path), delete=False
+                ) as f:
+                    f.write(content)
+
+                os.replace(f.name, path)
+
+                self.disk_bytes += len(content)
+
+            self.index[key] = {
+                "key": key,
+                "etag": etag,
+                "digest": digest,
+                "size": len(content),
+            }
+
+            self.put_memory(digest, content)
+
+            while self.disk_bytes > self.max_disk_bytes and len(self.index) > 1:
+                _, entry = self.index.popitem(last=False)
+
+                self.release(entry["digest"])
+
+            self.save_index()
+
+    def put_memory(self, digest, content):
+        if len(content) > self.max_memory_bytes or digest in self.memory:
+            return
+
+        self.memory[digest] = content
+
+        self.memory_bytes += len(content)
+
+        while self.memory_bytes > self.max_memory_bytes:
+            _, evicted = self.memory.popitem(last=False)
+
+            self.memory_bytes -= len(evicted)
+
+    def release(self, digest):
+        if any(entry["digest"] == digest for entry in self.index.values()):
+            return
+
+        evicted = self.memory.pop(digest, None)
+
+        if evicted is not None:
+            self.memory_bytes -= len(evicted)
+
+        path = self.get_path(digest)
+
+        try:
+            self.disk_bytes -= os.path.getsize(path)
+
+            os.remove(path)
+
+        except OSError:
+            pass
+
+    def get_stats(self):
+        """
+        Method Name :   get_stats
+        Description :   This method is used for getting the hit and miss counters and the bytes used by the cache
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self.index),
+                "memory_bytes": self.memory_bytes,
+                "disk_bytes": self.disk_bytes,
+            }
+
+
+_blob_cache = None
+
+_blob_cache_lock = threading.Lock()
+
+
+def get_blob_cache(cache_config):
+    """
+    Method Name :   get_blob_cache
+    Description :   This method is used for getting the process wide blob cache, which is created on first use
+
+    Version     :   1.2
+    Revisions   :   moved setup to cloud
+    """
+    global _blob_cache
+
+    with _blob_cache_lock:
+        if _blob_cache is None:
+            _blob_cache = Blob_Cache(
+                cache_dir=cache_config["dir"],
+                max_memory_bytes=cache_config["max_memory_bytes"],
+                max_disk_bytes=cache_config["max_disk_bytes"],
+            )
+
+        return _blob_cache
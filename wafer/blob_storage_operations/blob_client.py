@@ -0,0 +1,94 @@
+import threading
+
+import requests
+from azure.core.pipeline.transport import RequestsTransport
+from azure.storage.blob import BlobServiceClient
+from requests.adapters import HTTPAdapter
+
+
+class Blob_Client_Registry:
+    """
+    Description :   This class is used for sharing one BlobServiceClient per connection string across
+                    all the Blob_Operation instances of the process, container clients are cached and
+                    share the http session of the service client, so that tls connections are reused
+
+    Version     :   1.2
+    Revisions   :   moved to setup to cloud
+    """
+
+    def __init__(self):
+        self.service_clients = {}
+
+        self.container_clients = {}
+
+        self.lock = threading.Lock()
+
+    def get_transport(self, pool_config):
+        """
+        Method Name :   get_transport
+        Description :   This method is used for creating the http transport with a pooled requests session
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        session = requests.Session()
+
+        adapter = HTTPAdapter(
+            pool_connections=pool_config["max_connections"],
+            pool_maxsize=pool_config["max_connections"],
+        )
+
+        session.mount("https://", adapter)
+
+        session.mount("http://", adapter)
+
+        return RequestsTransport(
+            session=session,
+            session_owner=False,
+            connection_timeout=pool_config["connection_timeout"],
+            read_timeout=pool_config["read_timeout"],
+        )
+
+    def get_service_client(self, conn_str, pool_config):
+        """
+        Method Name :   get_service_client
+        Description :   This method is used for getting the shared service client for the connection string
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        with self.lock:
+            if conn_str not in self.service_clients:
+                self.service_clients[
+                    conn_str
+                ] = BlobServiceClient.from_connection_string(
+                    conn_str=conn_str, transport=self.get_transport(pool_config)
+                )
+
+            return self.service_clients[conn_str]
+
+    def get_container_client(self, conn_str, container_name, pool_config):
+        """
+        Method Name :   get_container_client
+        Description :   This method is used for getting the cached container client, created from the shared
+                        service client
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        service_client = self.get_service_client(
+            conn_str=conn_str, pool_config=pool_config
+        )
+
+        with self.lock:
+            key = (conn_str, container_name)
+
+            if key not in self.container_clients:
+                self.container_clients[key] = service_client.get_container_client(
+                    container=container_name
+                )
+
+            return self.container_clients[key]
+
+
+blob_client_registry = Blob_Client_Registry()
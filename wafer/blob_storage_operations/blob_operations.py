@@ -1,20 +1,34 @@
+import csv
+import hashlib
 import json
 import os
 import pickle
-from io import StringIO
-
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO, StringIO
+from itertools import chain
+
+import numpy as np
 import pandas as pd
-from azure.storage.blob import BlobServiceClient, ContainerClient
+import pyarrow as pa
+import pyarrow.parquet as pq
+from azure.core import MatchConditions
+from azure.core.exceptions import ResourceExistsError, ResourceNotModifiedError
+from azure.storage.blob import ContentSettings
 from utils.logger import App_Logger
 from utils.model_utils import Model_Utils
 from utils.read_params import read_params
+from wafer.blob_storage_operations.blob_cache import Cached_Object, get_blob_cache
+from wafer.blob_storage_operations.blob_client import blob_client_registry
 
 
 class Blob_Operation:
     def __init__(self):
         self.config = read_params()
 
-        self.connection_string = os.environ["AZURE_CONN_STR"]
+        self.connection_string = self.get_connection_string()
 
         self.class_name = self.__class__.__name__
 
@@ -24,6 +38,43 @@ class Blob_Operation:
 
         self.model_save_format = self.config["model_utils"]["save_format"]
 
+        self.pool_config = self.config["blob"]["pool"]
+
+        self.read_concurrency = self.config["blob"]["read_concurrency"]
+
+        self.read_stats = []
+
+        self.read_prefetch = self.config["blob"]["read_prefetch"]
+
+        self.header_range_bytes = self.config["blob"]["header_range_bytes"]
+
+        self.upload_chunk_rows = self.config["blob"]["upload_chunk_rows"]
+
+        self.copy_config = self.config["blob"]["copy"]
+
+        self.delete_config = self.config["blob"]["delete"]
+
+        self.cache_config = self.config["blob"]["cache"]
+
+        self.export_format = self.config["export_file"]["format"]
+
+        self.export_float_dtype = self.config["export_file"]["float_dtype"]
+
+        self.export_id_column = self.config["export_file"]["id_column"]
+
+        self.export_spool_max_bytes = self.config["export_file"]["spool_max_bytes"]
+
+        func = (
+            lambda: get_blob_cache(self.cache_config)
+            if self.cache_config["enabled"] is True
+            else None
+        )
+
+        self.blob_cache = func()
+
+    def get_connection_string(self):
+        return os.environ["AZURE_CONN_STR"]
+
     def get_container_client(self, container_name, db_name, collection_name):
         method_name = self.get_container_client.__name__
 
@@ -36,14 +87,16 @@ class Blob_Operation:
         )
 
         try:
-            container_client = ContainerClient.from_connection_string(
-                conn_str=self.connection_string, container_name=container_name
+            container_client = blob_client_registry.get_container_client(
+                conn_str=self.connection_string,
+                container_name=container_name,
+                pool_config=self.pool_config,
             )
 
             self.log_writer.log(
                 db_name=db_name,
                 collection_name=collection_name,
-                log_info="Got container client from connection string",
+                log_info="Got container client from shared blob service client",
             )
 
             self.log_writer.start_log(
@@ -69,8 +122,8 @@ class Blob_Operation:
         method_name = self.get_blob_client.__name__
 
         try:
-            client = BlobServiceClient.from_connection_string(
-                conn_str=self.connection_string
+            client = blob_client_registry.get_service_client(
+                conn_str=self.connection_string, pool_config=self.pool_config
             )
 
             blob_client = client.get_blob_client(
@@ -100,15 +153,16 @@ class Blob_Operation:
         )
 
         try:
-            client = ContainerClient.from_connection_string(
+            client = blob_client_registry.get_container_client(
                 conn_str=self.connection_string,
                 container_name=container_name,
+                pool_config=self.pool_config,
             )
 
             self.log_writer.log(
                 db_name=db_name,
                 collection_name=collection_name,
-                log_info="Got container client from connection string",
+                log_info="Got container client from shared blob service client",
             )
 
             if client.exists() is True:
@@ -248,6 +302,7 @@ class Blob_Operation:
         collection_name,
         remove=True,
         replace=True,
+        etag=None,
     ):
         method_name = self.upload_file.__name__
 
@@ -260,56 +315,22 @@ class Blob_Operation:
         )
 
         try:
-            client = self.get_container_client(
-                container_name=container_name,
-                db_name=db_name,
-                collection_name=collection_name,
-            )
-
-            if replace is True:
-                f = self.load_file(
+            with open(file=local_file_name, mode="rb") as f:
+                new_etag = self.upload_data(
+                    data=f,
+                    container_file_name=container_file_name,
                     container_name=container_name,
-                    file=container_file_name,
-                    db_name=db_name,
-                    collection_name=collection_name,
-                )
-
-                self.log_writer.log(
-                    db_name=db_name,
-                    collection_name=collection_name,
-                    log_info=f"{container_file_name} file exists is {f}, and replace option is set to {replace}..Deleting the file",
-                )
-
-                if f is True:
-                    self.delete_file(
-                        file_name=container_file_name,
-                        container_name=container_name,
-                        db_name=db_name,
-                        collection_name=collection_name,
-                    )
-
-                else:
-                    self.log_writer.log(
-                        db_name=db_name,
-                        collection_name=collection_name,
-                        log_info=f"{container_file_name} file exists is {f}",
-                    )
-
-                with open(file=local_file_name, mode="rb") as f:
-                    client.upload_blob(data=f, name=container_file_name)
-
-                self.log_writer.log(
                     db_name=db_name,
                     collection_name=collection_name,
-                    log_info=f"Uploaded {local_file_name} to {container_name} container with name as {container_file_name} file",
+                    replace=replace,
+                    etag=etag,
                 )
 
-            else:
-                self.log_writer.log(
-                    db_name=db_name,
-                    collection_name=collection_name,
-                    log_info=f"Replace option is set to {replace}, not replacing the {container_file_name} file in {container_name} container",
-                )
+            self.log_writer.log(
+                db_name=db_name,
+                collection_name=collection_name,
+                log_info=f"Uploaded {local_file_name} to {container_name} container with name as {container_file_name} file",
+            )
 
             if remove is True:
                 os.remove(local_file_name)
@@ -327,6 +348,16 @@ class Blob_Operation:
                     log_info=f"Removed option is set to {remove}, not removing the {local_file_name} from local",
                 )
 
+            self.log_writer.start_log(
+                key="exit",
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+            return new_etag
+
         except Exception as e:
             self.log_writer.exception_log(
                 error=e,
@@ -379,10 +410,20 @@ class Blob_Operation:
                 collection_name=collection_name,
             )
 
-    def get_object(self, file_name, container_name, db_name, collection_name):
+    def get_object(
+        self, file_name, container_name, db_name, collection_name, cache=False
+    ):
         method_name = self.get_object.__name__
 
         try:
+            if cache is True and self.blob_cache is not None:
+                return self.get_cached_object(
+                    file_name=file_name,
+                    container_name=container_name,
+                    db_name=db_name,
+                    collection_name=collection_name,
+                )
+
             client = self.get_container_client(
                 container_name=container_name,
                 db_name=db_name,
@@ -416,6 +457,81 @@ class Blob_Operation:
                 collection_name=collection_name,
             )
 
+    def get_cached_object(self, file_name, container_name, db_name, collection_name):
+        method_name = self.get_cached_object.__name__
+
+        self.log_writer.start_log(
+            key="start",
+            class_name=self.class_name,
+            method_name=method_name,
+            db_name=db_name,
+            collection_name=collection_name,
+        )
+
+        try:
+            client = self.get_container_client(
+                container_name=container_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+            key = container_name + "/" + file_name
+
+            etag = self.blob_cache.get_etag(key)
+
+            f, content = None, None
+
+            if etag is not None:
+                try:
+                    f = client.download_blob(
+                        blob=file_name,
+                        etag=etag,
+                        match_condition=MatchConditions.IfModified,
+                    )
+
+                except ResourceNotModifiedError:
+                    content = self.blob_cache.get(key)
+
+            if content is not None:
+                self.log_writer.log(
+                    db_name=db_name,
+                    collection_name=collection_name,
+                    log_info=f"{file_name} file in {container_name} container is not modified since etag {etag}, read from cache",
+                )
+
+            else:
+                if f is None:
+                    f = client.download_blob(blob=file_name)
+
+                content = f.readall()
+
+                self.blob_cache.put(key=key, etag=f.properties.etag, content=content)
+
+                self.log_writer.log(
+                    db_name=db_name,
+                    collection_name=collection_name,
+                    log_info=f"Downloaded {file_name} file from {container_name} container with etag {f.properties.etag} into cache",
+                )
+
+            self.log_writer.start_log(
+                key="exit",
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+            return Cached_Object(content)
+
+        except Exception as e:
+            self.log_writer.exception_log(
+                error=e,
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
     def read_object(
         self, object, db_name, collection_name, decode=True, make_readable=False
     ):
@@ -477,9 +593,10 @@ class Blob_Operation:
         try:
             f_obj = self.get_object(
                 container_name=container_name,
-                local_file_name=file_name,
+                file_name=file_name,
                 db_name=db_name,
                 collection_name=collection_name,
+                cache=True,
             )
 
             content = self.read_object(
@@ -519,9 +636,10 @@ class Blob_Operation:
         try:
             f_obj = self.get_object(
                 container_name=container_name,
-                local_file_name=file_name,
+                file_name=file_name,
                 db_name=db_name,
                 collection_name=collection_name,
+                cache=True,
             )
 
             json_content = self.read_object(
@@ -555,7 +673,7 @@ class Blob_Operation:
                 collection_name=collection_name,
             )
 
-    def get_df_from_object(self, object, db_name, collection_name):
+    def get_df_from_object(self, object, db_name, collection_name, columns=None):
         method_name = self.get_df_from_object.__name__
 
         self.log_writer.start_log(
@@ -574,7 +692,7 @@ class Blob_Operation:
                 collection_name=collection_name,
             )
 
-            df = pd.read_csv(content)
+            df = pd.read_csv(content, usecols=columns)
 
             self.log_writer.log(
                 db_name=db_name,
@@ -652,10 +770,18 @@ class Blob_Operation:
                 collection_name=collection_name,
             )
 
-    def read_csv_from_folder(
-        self, folder_name, container_name, db_name, collection_name
-    ):
-        method_name = self.read_csv_from_folder.__name__
+    def get_file_versions(self, folder_name, container_name, db_name, collection_name):
+        """
+        Method Name :   get_file_versions
+        Description :   This method is used for getting the version of every file in the folder from the blob
+                        listing, without downloading them. The version is the content md5 when the blob has one,
+                        which upload_df_as_csv sets, else its etag
+        Output      :   A dict of file name to version
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        method_name = self.get_file_versions.__name__
 
         self.log_writer.start_log(
             key="start",
@@ -664,32 +790,28 @@ class Blob_Operation:
             db_name=db_name,
             collection_name=collection_name,
         )
+
         try:
-            files = self.get_files_from_folder(
-                folder_name=folder_name,
+            client = self.get_container_client(
                 container_name=container_name,
                 db_name=db_name,
                 collection_name=collection_name,
             )
 
-            lst = [
-                (
-                    self.read_csv(
-                        file_name=f,
-                        container_name=container_name,
-                        db_name=db_name,
-                        collection_name=collection_name,
-                    ),
-                    f,
-                    f.split("/")[-1],
-                )
-                for f in files
-            ]
+            blob_list = client.list_blobs(name_starts_with=folder_name + "/")
+
+            get_version = (
+                lambda f: bytes(f.content_settings.content_md5).hex()
+                if f.content_settings.content_md5
+                else f.etag
+            )
+
+            versions = {f.name: get_version(f) for f in blob_list}
 
             self.log_writer.log(
                 db_name=db_name,
                 collection_name=collection_name,
-                log_info=f"Read csv files from {folder_name} folder from {container_name} container",
+                log_info=f"Got versions of {len(versions)} files from {folder_name} folder from {container_name} container",
             )
 
             self.log_writer.start_log(
@@ -700,7 +822,7 @@ class Blob_Operation:
                 collection_name=collection_name,
             )
 
-            return lst
+            return versions
 
         except Exception as e:
             self.log_writer.exception_log(
@@ -711,18 +833,12 @@ class Blob_Operation:
                 collection_name=collection_name,
             )
 
-    def read_csv(self, file_name, container_name, db_name, collection_name):
-        method_name = self.read_csv.__name__
-
-        self.log_writer.start_log(
-            key="start",
-            class_name=self.class_name,
-            method_name=method_name,
-            db_name=db_name,
-            collection_name=collection_name,
-        )
+    def read_csv_with_stats(self, file_name, container_name, db_name, collection_name):
+        method_name = self.read_csv_with_stats.__name__
 
         try:
+            start_time = time.perf_counter()
+
             csv_obj = self.get_object(
                 file_name=file_name,
                 container_name=container_name,
@@ -730,25 +846,22 @@ class Blob_Operation:
                 collection_name=collection_name,
             )
 
+            download_time = time.perf_counter()
+
             df = self.get_df_from_object(
                 object=csv_obj, db_name=db_name, collection_name=collection_name
             )
 
-            self.log_writer.log(
-                db_name=db_name,
-                collection_name=collection_name,
-                log_info=f"Read {file_name} csv file from {container_name} container",
-            )
+            end_time = time.perf_counter()
 
-            self.log_writer.start_log(
-                key="exit",
-                class_name=self.class_name,
-                method_name=method_name,
-                db_name=db_name,
-                collection_name=collection_name,
-            )
+            stats = {
+                "file": file_name,
+                "bytes": csv_obj.size,
+                "download_secs": round(download_time - start_time, 4),
+                "parse_secs": round(end_time - download_time, 4),
+            }
 
-            return df
+            return df, stats
 
         except Exception as e:
             self.log_writer.exception_log(
@@ -759,8 +872,10 @@ class Blob_Operation:
                 collection_name=collection_name,
             )
 
-    def get_blob_url(self, file_name, container_name, db_name, collection_name):
-        method_name = self.get_blob_url.__name__
+    def iter_csv_files(
+        self, files, container_name, db_name, collection_name, prefetch=None
+    ):
+        method_name = self.iter_csv_files.__name__
 
         self.log_writer.start_log(
             key="start",
@@ -771,25 +886,52 @@ class Blob_Operation:
         )
 
         try:
-            blob_client = self.get_blob_client(
-                blob_file_name=file_name,
-                container_name=container_name,
-                db_name=db_name,
-                collection_name=collection_name,
-            )
+            func = lambda: self.read_prefetch if prefetch is None else prefetch
 
-            self.log_writer.log(
-                db_name=db_name,
-                collection_name=collection_name,
-                log_info=f"Got {file_name} blob from {container_name} container",
-            )
+            window = func()
 
-            f = blob_client.url
+            pending = deque()
+
+            self.read_stats = []
+
+            start_time = time.perf_counter()
+
+            with ThreadPoolExecutor(max_workers=max(window, 1)) as executor:
+                for f in files:
+                    future = executor.submit(
+                        self.read_csv_with_stats,
+                        file_name=f,
+                        container_name=container_name,
+                        db_name=db_name,
+                        collection_name=collection_name,
+                    )
+
+                    pending.append((f, future))
+
+                    if len(pending) > window:
+                        file, future = pending.popleft()
+
+                        df, stats = future.result()
+
+                        self.read_stats.append(stats)
+
+                        yield df, file, file.split("/")[-1]
+
+                while pending:
+                    file, future = pending.popleft()
+
+                    df, stats = future.result()
+
+                    self.read_stats.append(stats)
+
+                    yield df, file, file.split("/")[-1]
+
+            total_bytes = sum(stat["bytes"] for stat in self.read_stats)
 
             self.log_writer.log(
                 db_name=db_name,
                 collection_name=collection_name,
-                log_info=f"Got {file_name} blob url",
+                log_info=f"Streamed {len(files)} csv files ({total_bytes} bytes) from {container_name} container with prefetch of {window} files in {round(time.perf_counter() - start_time, 4)} secs",
             )
 
             self.log_writer.start_log(
@@ -800,7 +942,35 @@ class Blob_Operation:
                 collection_name=collection_name,
             )
 
-            return f
+        except Exception as e:
+            self.log_writer.exception_log(
+                error=e,
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+    def iter_csv_from_folder(
+        self, folder_name, container_name, db_name, collection_name, prefetch=None
+    ):
+        method_name = self.iter_csv_from_folder.__name__
+
+        try:
+            files = self.get_files_from_folder(
+                folder_name=folder_name,
+                container_name=container_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+            return self.iter_csv_files(
+                files=files,
+                container_name=container_name,
+                db_name=db_name,
+                collection_name=collection_name,
+                prefetch=prefetch,
+            )
 
         except Exception as e:
             self.log_writer.exception_log(
@@ -811,16 +981,25 @@ class Blob_Operation:
                 collection_name=collection_name,
             )
 
-    def copy_data(
+    def read_csv(
         self,
-        from_file_name,
-        from_container_name,
-        to_file_name,
-        to_container_name,
+        file_name,
+        container_name,
         db_name,
         collection_name,
+        columns=None,
+        cache=False,
     ):
-        method_name = self.copy_data.__name__
+        """
+        Method Name :   read_csv
+        Description :   This method is used for reading the csv file as a dataframe, the batch files are read
+                        without the blob cache, which is only used for small artifacts like the export file
+        Output      :   A dataframe with the columns of the file, or only columns if given
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        method_name = self.read_csv.__name__
 
         self.log_writer.start_log(
             key="start",
@@ -831,27 +1010,25 @@ class Blob_Operation:
         )
 
         try:
-            dest_client = self.get_container_client(
-                container_name=to_container_name,
+            csv_obj = self.get_object(
+                file_name=file_name,
+                container_name=container_name,
                 db_name=db_name,
                 collection_name=collection_name,
+                cache=cache,
             )
 
-            from_blob = self.get_blob_url(
-                container_name=from_container_name,
-                local_file_name=from_file_name,
+            df = self.get_df_from_object(
+                object=csv_obj,
                 db_name=db_name,
                 collection_name=collection_name,
+                columns=columns,
             )
 
-            to_blob = dest_client.get_blob_client(blob=to_file_name)
-
-            to_blob.start_copy_from_url(from_blob)
-
             self.log_writer.log(
                 db_name=db_name,
                 collection_name=collection_name,
-                log_info=f"Copied {from_file_name} file from {from_container_name} container to {to_file_name} file from {to_container_name}",
+                log_info=f"Read {file_name} csv file from {container_name} container",
             )
 
             self.log_writer.start_log(
@@ -862,6 +1039,8 @@ class Blob_Operation:
                 collection_name=collection_name,
             )
 
+            return df
+
         except Exception as e:
             self.log_writer.exception_log(
                 error=e,
@@ -871,16 +1050,51 @@ class Blob_Operation:
                 collection_name=collection_name,
             )
 
-    def move_data(
-        self,
-        from_file_name,
-        from_container_name,
-        to_file_name,
-        to_container_name,
-        db_name,
-        collection_name,
-    ):
-        method_name = self.move_data.__name__
+    def read_csv_header(self, file_name, container_name, db_name, collection_name):
+        method_name = self.read_csv_header.__name__
+
+        try:
+            client = self.get_container_client(
+                container_name=container_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+            length = self.header_range_bytes
+
+            while True:
+                content = client.download_blob(
+                    blob=file_name, offset=0, length=length
+                ).readall()
+
+                if b"\n" in content or len(content) < length:
+                    break
+
+                length *= 2
+
+            header_line = content.split(b"\n", 1)[0].decode().rstrip("\r")
+
+            columns = next(csv.reader([header_line]))
+
+            self.log_writer.log(
+                db_name=db_name,
+                collection_name=collection_name,
+                log_info=f"Read header of {file_name} csv file from {container_name} container with {len(content)} bytes ranged download",
+            )
+
+            return columns
+
+        except Exception as e:
+            self.log_writer.exception_log(
+                error=e,
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+    def read_csv_headers(self, files, container_name, db_name, collection_name):
+        method_name = self.read_csv_headers.__name__
 
         self.log_writer.start_log(
             key="start",
@@ -891,26 +1105,23 @@ class Blob_Operation:
         )
 
         try:
-            self.copy_data(
-                from_file_name=from_file_name,
-                from_container_name=from_container_name,
-                to_file_name=to_file_name,
-                to_container_name=to_container_name,
-                db_name=db_name,
-                collection_name=collection_name,
-            )
+            with ThreadPoolExecutor(max_workers=self.read_concurrency) as executor:
+                headers = executor.map(
+                    lambda f: self.read_csv_header(
+                        file_name=f,
+                        container_name=container_name,
+                        db_name=db_name,
+                        collection_name=collection_name,
+                    ),
+                    files,
+                )
 
-            self.delete_file(
-                file_name=from_file_name,
-                container_name=from_container_name,
-                db_name=db_name,
-                collection_name=collection_name,
-            )
+                dic = dict(zip(files, headers))
 
             self.log_writer.log(
                 db_name=db_name,
                 collection_name=collection_name,
-                log_info=f"Moved {from_file_name} file from {from_container_name} container to {to_container_name} container,with {to_file_name} file as name",
+                log_info=f"Read headers of {len(dic)} csv files from {container_name} container",
             )
 
             self.log_writer.start_log(
@@ -921,6 +1132,8 @@ class Blob_Operation:
                 collection_name=collection_name,
             )
 
+            return dic
+
         except Exception as e:
             self.log_writer.exception_log(
                 error=e,
@@ -930,10 +1143,8 @@ class Blob_Operation:
                 collection_name=collection_name,
             )
 
-    def load_model(
-        self, model_name, container_name, db_name, collection_name, model_dir=None
-    ):
-        method_name = self.load_model.__name__
+    def get_blob_url(self, file_name, container_name, db_name, collection_name):
+        method_name = self.get_blob_url.__name__
 
         self.log_writer.start_log(
             key="start",
@@ -944,40 +1155,25 @@ class Blob_Operation:
         )
 
         try:
-            func = (
-                lambda: model_name + self.model_save_format
-                if model_dir is None
-                else model_dir + model_name + self.model_save_format
-            )
-
-            model_file = func()
-
-            self.log_writer.log(
-                db_name=db_name,
-                collection_name=collection_name,
-                log_info=f"Got {model_file} as model file",
-            )
-
-            f_obj = self.get_object(
-                file_name=model_file,
+            blob_client = self.get_blob_client(
+                blob_file_name=file_name,
                 container_name=container_name,
                 db_name=db_name,
                 collection_name=collection_name,
             )
 
-            model_content = self.read_object(
-                object=f_obj,
+            self.log_writer.log(
                 db_name=db_name,
                 collection_name=collection_name,
-                decode=False,
+                log_info=f"Got {file_name} blob from {container_name} container",
             )
 
-            model = pickle.loads(model_content)
+            f = blob_client.url
 
             self.log_writer.log(
-                db_name=self.class_name,
+                db_name=db_name,
                 collection_name=collection_name,
-                log_info=f"Loaded {model_name} model from {container_name} container",
+                log_info=f"Got {file_name} blob url",
             )
 
             self.log_writer.start_log(
@@ -988,7 +1184,7 @@ class Blob_Operation:
                 collection_name=collection_name,
             )
 
-            return model
+            return f
 
         except Exception as e:
             self.log_writer.exception_log(
@@ -999,10 +1195,47 @@ class Blob_Operation:
                 collection_name=collection_name,
             )
 
-    def save_model(
-        self, model, model_dir, container_name, db_name, collection_name, idx=None
+    def wait_for_copy(self, blob_client, copy_status, db_name, collection_name):
+        method_name = self.wait_for_copy.__name__
+
+        try:
+            interval = self.copy_config["poll_interval"]
+
+            deadline = time.monotonic() + self.copy_config["timeout"]
+
+            while copy_status == "pending":
+                if time.monotonic() > deadline:
+                    raise Exception(
+                        f"Copy to {blob_client.blob_name} did not complete in {self.copy_config['timeout']} secs"
+                    )
+
+                time.sleep(interval)
+
+                interval = min(interval * 2, self.copy_config["max_poll_interval"])
+
+                copy_status = blob_client.get_blob_properties().copy.status
+
+            return copy_status
+
+        except Exception as e:
+            self.log_writer.exception_log(
+                error=e,
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+    def copy_data(
+        self,
+        from_file_name,
+        from_container_name,
+        to_file_name,
+        to_container_name,
+        db_name,
+        collection_name,
     ):
-        method_name = self.save_model.__name__
+        method_name = self.copy_data.__name__
 
         self.log_writer.start_log(
             key="start",
@@ -1013,53 +1246,39 @@ class Blob_Operation:
         )
 
         try:
-            model_name = self.model_utils.get_model_name(
-                model=model, db_name=db_name, collection_name=collection_name
-            )
-
-            func = (
-                lambda: model_name + self.model_save_format
-                if model_name == "KMeans"
-                else model_name + str(idx) + self.model_save_format
+            dest_client = self.get_container_client(
+                container_name=to_container_name,
+                db_name=db_name,
+                collection_name=collection_name,
             )
 
-            model_file = func()
-
-            self.log_writer.log(
+            from_blob = self.get_blob_url(
+                container_name=from_container_name,
+                file_name=from_file_name,
                 db_name=db_name,
                 collection_name=collection_name,
-                log_info=f"Local copy of {model_name} model file name is created",
             )
 
-            dir_func = (
-                lambda: model_dir + "/" + model_file
-                if model_dir is not None
-                else model_file
-            )
+            to_blob = dest_client.get_blob_client(blob=to_file_name)
 
-            container_model_file = dir_func()
+            copy = to_blob.start_copy_from_url(from_blob)
 
-            self.log_writer.log(
+            copy_status = self.wait_for_copy(
+                blob_client=to_blob,
+                copy_status=copy["copy_status"],
                 db_name=db_name,
                 collection_name=collection_name,
-                log_info=f"Container location of {model_name} model file name is created ",
             )
 
-            with open(file=model_file, mode="wb") as f:
-                pickle.dump(model, f)
+            if copy_status != "success":
+                raise Exception(
+                    f"Copy of {from_file_name} file to {to_file_name} file ended with {copy_status} status"
+                )
 
             self.log_writer.log(
                 db_name=db_name,
                 collection_name=collection_name,
-                log_info=f"Saved local copy of {model_name} model",
-            )
-
-            self.upload_file(
-                local_file_name=model_file,
-                container_file_name=container_model_file,
-                container_name=container_name,
-                db_name=db_name,
-                collection_name=collection_name,
+                log_info=f"Copied {from_file_name} file from {from_container_name} container to {to_file_name} file from {to_container_name}",
             )
 
             self.log_writer.start_log(
@@ -1079,8 +1298,16 @@ class Blob_Operation:
                 collection_name=collection_name,
             )
 
-    def delete_folder(self, folder_name, container_name, db_name, collection_name):
-        method_name = self.delete_folder.__name__
+    def move_data(
+        self,
+        from_file_name,
+        from_container_name,
+        to_file_name,
+        to_container_name,
+        db_name,
+        collection_name,
+    ):
+        method_name = self.move_data.__name__
 
         self.log_writer.start_log(
             key="start",
@@ -1091,25 +1318,26 @@ class Blob_Operation:
         )
 
         try:
-            files = self.get_files_from_folder(
-                folder_name=folder_name,
-                container_name=container_name,
+            self.copy_data(
+                from_file_name=from_file_name,
+                from_container_name=from_container_name,
+                to_file_name=to_file_name,
+                to_container_name=to_container_name,
                 db_name=db_name,
                 collection_name=collection_name,
             )
 
-            for f in files:
-                self.delete_file(
-                    file_name=f,
-                    container_name=container_name,
-                    db_name=db_name,
-                    collection_name=collection_name,
-                )
+            self.delete_file(
+                file_name=from_file_name,
+                container_name=from_container_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
 
             self.log_writer.log(
                 db_name=db_name,
                 collection_name=collection_name,
-                log_info=f"{folder_name} folder is deleted from {container_name} container",
+                log_info=f"Moved {from_file_name} file from {from_container_name} container to {to_container_name} container,with {to_file_name} file as name",
             )
 
             self.log_writer.start_log(
@@ -1129,16 +1357,57 @@ class Blob_Operation:
                 collection_name=collection_name,
             )
 
-    def upload_df_as_csv(
+    def copy_file_with_report(
         self,
-        dataframe,
-        local_file_name,
-        container_file_name,
-        container_name,
+        from_file_name,
+        from_container_name,
+        to_file_name,
+        to_container_name,
         db_name,
         collection_name,
+        delete_source,
     ):
-        method_name = self.upload_df_as_csv.__name__
+        start_time = time.perf_counter()
+
+        report = {"from_file": from_file_name, "to_file": to_file_name}
+
+        try:
+            self.copy_data(
+                from_file_name=from_file_name,
+                from_container_name=from_container_name,
+                to_file_name=to_file_name,
+                to_container_name=to_container_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+            if delete_source is True:
+                self.delete_file(
+                    file_name=from_file_name,
+                    container_name=from_container_name,
+                    db_name=db_name,
+                    collection_name=collection_name,
+                )
+
+            report.update(status="success", error=None)
+
+        except Exception as e:
+            report.update(status="failed", error=str(e))
+
+        report["secs"] = round(time.perf_counter() - start_time, 4)
+
+        return report
+
+    def copy_files(
+        self,
+        file_pairs,
+        from_container_name,
+        to_container_name,
+        db_name,
+        collection_name,
+        delete_source=False,
+    ):
+        method_name = self.copy_files.__name__
 
         self.log_writer.start_log(
             key="start",
@@ -1149,30 +1418,858 @@ class Blob_Operation:
         )
 
         try:
-            dataframe.to_csv(local_file_name, index=None, header=True)
+            with ThreadPoolExecutor(
+                max_workers=self.copy_config["concurrency"]
+            ) as executor:
+                reports = list(
+                    executor.map(
+                        lambda pair: self.copy_file_with_report(
+                            from_file_name=pair[0],
+                            from_container_name=from_container_name,
+                            to_file_name=pair[1],
+                            to_container_name=to_container_name,
+                            db_name=db_name,
+                            collection_name=collection_name,
+                            delete_source=delete_source,
+                        ),
+                        file_pairs,
+                    )
+                )
+
+            failed = [r for r in reports if r["status"] != "success"]
 
             self.log_writer.log(
                 db_name=db_name,
                 collection_name=collection_name,
-                log_info=f"Created a local copy of dataframe with name {local_file_name}",
+                log_info=f"Copied {len(reports) - len(failed)} of {len(reports)} files from {from_container_name} container to {to_container_name} container with delete source as {delete_source}, failed files are {[r['from_file'] for r in failed]}",
             )
 
-            self.upload_file(
-                local_file_name=local_file_name,
-                container_file_name=container_file_name,
-                container_name=container_name,
+            self.log_writer.start_log(
+                key="exit",
+                class_name=self.class_name,
+                method_name=method_name,
                 db_name=db_name,
                 collection_name=collection_name,
             )
 
-            self.log_writer.start_log(
-                key="exit",
+            return reports
+
+        except Exception as e:
+            self.log_writer.exception_log(
+                error=e,
                 class_name=self.class_name,
                 method_name=method_name,
                 db_name=db_name,
                 collection_name=collection_name,
             )
 
+    def move_files(
+        self,
+        file_pairs,
+        from_container_name,
+        to_container_name,
+        db_name,
+        collection_name,
+    ):
+        return self.copy_files(
+            file_pairs=file_pairs,
+            from_container_name=from_container_name,
+            to_container_name=to_container_name,
+            db_name=db_name,
+            collection_name=collection_name,
+            delete_source=True,
+        )
+
+    def load_model(
+        self, model_name, container_name, db_name, collection_name, model_dir=None
+    ):
+        method_name = self.load_model.__name__
+
+        self.log_writer.start_log(
+            key="start",
+            class_name=self.class_name,
+            method_name=method_name,
+            db_name=db_name,
+            collection_name=collection_name,
+        )
+
+        try:
+            func = (
+                lambda: model_name + self.model_save_format
+                if model_dir is None
+                else model_dir + "/" + model_name + self.model_save_format
+            )
+
+            model_file = func()
+
+            self.log_writer.log(
+                db_name=db_name,
+                collection_name=collection_name,
+                log_info=f"Got {model_file} as model file",
+            )
+
+            f_obj = self.get_object(
+                file_name=model_file,
+                container_name=container_name,
+                db_name=db_name,
+                collection_name=collection_name,
+                cache=True,
+            )
+
+            model_content = self.read_object(
+                object=f_obj,
+                db_name=db_name,
+                collection_name=collection_name,
+                decode=False,
+            )
+
+            model = pickle.loads(model_content)
+
+            self.log_writer.log(
+                db_name=self.class_name,
+                collection_name=collection_name,
+                log_info=f"Loaded {model_name} model from {container_name} container",
+            )
+
+            self.log_writer.start_log(
+                key="exit",
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+            return model
+
+        except Exception as e:
+            self.log_writer.exception_log(
+                error=e,
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+    def save_model(
+        self, model, model_dir, container_name, db_name, collection_name, idx=None
+    ):
+        method_name = self.save_model.__name__
+
+        self.log_writer.start_log(
+            key="start",
+            class_name=self.class_name,
+            method_name=method_name,
+            db_name=db_name,
+            collection_name=collection_name,
+        )
+
+        try:
+            model_name = self.model_utils.get_model_name(
+                model=model, db_name=db_name, collection_name=collection_name
+            )
+
+            func = (
+                lambda: model_name + self.model_save_format
+                if model_name == "KMeans" or idx is None
+                else model_name + str(idx) + self.model_save_format
+            )
+
+            model_file = func()
+
+            self.log_writer.log(
+                db_name=db_name,
+                collection_name=collection_name,
+                log_info=f"{model_name} model file name is created",
+            )
+
+            dir_func = (
+                lambda: model_dir + "/" + model_file
+                if model_dir is not None
+                else model_file
+            )
+
+            container_model_file = dir_func()
+
+            self.log_writer.log(
+                db_name=db_name,
+                collection_name=collection_name,
+                log_info=f"Container location of {model_name} model file name is created ",
+            )
+
+            self.upload_data(
+                data=pickle.dumps(model),
+                container_file_name=container_model_file,
+                container_name=container_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+            self.log_writer.log(
+                db_name=db_name,
+                collection_name=collection_name,
+                log_info=f"Uploaded pickled {model_name} model without a local copy",
+            )
+
+            self.log_writer.start_log(
+                key="exit",
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+        except Exception as e:
+            self.log_writer.exception_log(
+                error=e,
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+    def delete_folder(self, folder_name, container_name, db_name, collection_name):
+        method_name = self.delete_folder.__name__
+
+        self.log_writer.start_log(
+            key="start",
+            class_name=self.class_name,
+            method_name=method_name,
+            db_name=db_name,
+            collection_name=collection_name,
+        )
+
+        try:
+            files = self.get_files_from_folder(
+                folder_name=folder_name,
+                container_name=container_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+            client = self.get_container_client(
+                container_name=container_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+            batch_size = self.delete_config["batch_size"]
+
+            batches = [
+                files[i : i + batch_size] for i in range(0, len(files), batch_size)
+            ]
+
+            with ThreadPoolExecutor(
+                max_workers=self.delete_config["concurrency"]
+            ) as executor:
+                responses = executor.map(
+                    lambda batch: list(
+                        client.delete_blobs(*batch, raise_on_any_failure=False)
+                    ),
+                    batches,
+                )
+
+                failed = [
+                    f
+                    for batch, batch_responses in zip(batches, responses)
+                    for f, response in zip(batch, batch_responses)
+                    if response.status_code not in (202, 404)
+                ]
+
+            summary = {
+                "deleted": len(files) - len(failed),
+                "failed": failed,
+                "batches": len(batches),
+            }
+
+            self.log_writer.log(
+                db_name=db_name,
+                collection_name=collection_name,
+                log_info=f"{folder_name} folder is deleted from {container_name} container with {summary['batches']} batch requests, deleted {summary['deleted']} files and failed to delete {failed} files",
+            )
+
+            self.log_writer.start_log(
+                key="exit",
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+            return summary
+
+        except Exception as e:
+            self.log_writer.exception_log(
+                error=e,
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+    def iter_csv_chunks(self, dataframe):
+        for i in range(0, max(len(dataframe), 1), self.upload_chunk_rows):
+            chunk = dataframe.iloc[i : i + self.upload_chunk_rows]
+
+            yield chunk.to_csv(index=None, header=(i == 0)).encode()
+
+    def upload_data(
+        self,
+        data,
+        container_file_name,
+        container_name,
+        db_name,
+        collection_name,
+        replace=True,
+        etag=None,
+    ):
+        method_name = self.upload_data.__name__
+
+        self.log_writer.start_log(
+            key="start",
+            class_name=self.class_name,
+            method_name=method_name,
+            db_name=db_name,
+            collection_name=collection_name,
+        )
+
+        try:
+            client = self.get_container_client(
+                container_name=container_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+            if etag is not None:
+                result = client.upload_blob(
+                    name=container_file_name,
+                    data=data,
+                    overwrite=True,
+                    etag=etag,
+                    match_condition=MatchConditions.IfNotModified,
+                )
+
+            else:
+                try:
+                    result = client.upload_blob(
+                        name=container_file_name, data=data, overwrite=replace
+                    )
+
+                except ResourceExistsError:
+                    self.log_writer.log(
+                        db_name=db_name,
+                        collection_name=collection_name,
+                        log_info=f"Replace option is set to {replace}, not replacing the {container_file_name} file in {container_name} container",
+                    )
+
+                    return None
+
+            self.log_writer.log(
+                db_name=db_name,
+                collection_name=collection_name,
+                log_info=f"Uploaded data to {container_name} container with name as {container_file_name} file, with replace as {replace} and etag precondition as {etag}",
+            )
+
+            self.log_writer.start_log(
+                key="exit",
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+            return result["etag"]
+
+        except Exception as e:
+            self.log_writer.exception_log(
+                error=e,
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+    def set_content_md5(
+        self,
+        file_name,
+        container_name,
+        content_md5,
+        content_type,
+        db_name,
+        collection_name,
+    ):
+        """
+        Method Name :   set_content_md5
+        Description :   This method is used for setting the content md5 of a blob uploaded in blocks, for which the
+                        service does not set one, so that the listing gives a version which only changes with the
+                        content
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        method_name = self.set_content_md5.__name__
+
+        try:
+            blob_client = self.get_blob_client(
+                blob_file_name=file_name,
+                container_name=container_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+            blob_client.set_http_headers(
+                content_settings=ContentSettings(
+                    content_type=content_type, content_md5=bytearray(content_md5)
+                )
+            )
+
+        except Exception as e:
+            self.log_writer.exception_log(
+                error=e,
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+    def upload_df_as_csv(
+        self,
+        dataframe,
+        container_file_name,
+        container_name,
+        db_name,
+        collection_name,
+    ):
+        method_name = self.upload_df_as_csv.__name__
+
+        self.log_writer.start_log(
+            key="start",
+            class_name=self.class_name,
+            method_name=method_name,
+            db_name=db_name,
+            collection_name=collection_name,
+        )
+
+        try:
+            digest = hashlib.md5()
+
+            def iter_chunks():
+                for chunk in self.iter_csv_chunks(dataframe):
+                    digest.update(chunk)
+
+                    yield chunk
+
+            self.upload_data(
+                data=iter_chunks(),
+                container_file_name=container_file_name,
+                container_name=container_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+            self.set_content_md5(
+                file_name=container_file_name,
+                container_name=container_name,
+                content_md5=digest.digest(),
+                content_type="text/csv",
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+            self.log_writer.log(
+                db_name=db_name,
+                collection_name=collection_name,
+                log_info=f"Streamed dataframe as csv to {container_file_name} file in {container_name} container with content md5 as {digest.hexdigest()}",
+            )
+
+            self.log_writer.start_log(
+                key="exit",
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+        except Exception as e:
+            self.log_writer.exception_log(
+                error=e,
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+    def get_export_schema(self, columns):
+        """
+        Method Name :   get_export_schema
+        Description :   This method is used for getting the fixed schema of the export file, the id column is a
+                        string and every other column is of export_file.float_dtype, so that the schema does not
+                        depend on the values of any one chunk
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        float_type = pa.from_numpy_dtype(np.dtype(self.export_float_dtype))
+
+        return pa.schema(
+            [
+                pa.field(
+                    col, pa.string() if col == self.export_id_column else float_type
+                )
+                for col in columns
+            ]
+        )
+
+    def get_typed_dataframe(self, dataframe):
+        df = dataframe.replace("NULL", np.nan)
+
+        value_cols = [col for col in df.columns if col != self.export_id_column]
+
+        if len(value_cols) > 0:
+            df[value_cols] = (
+                df[value_cols]
+                .apply(pd.to_numeric, errors="coerce")
+                .astype(self.export_float_dtype)
+            )
+
+        if self.export_id_column in df.columns:
+            df[self.export_id_column] = df[self.export_id_column].map(
+                lambda v: None if pd.isna(v) else str(v)
+            )
+
+        return df
+
+    def upload_df_as_parquet(
+        self,
+        dataframe,
+        container_file_name,
+        container_name,
+        db_name,
+        collection_name,
+    ):
+        method_name = self.upload_df_as_parquet.__name__
+
+        self.log_writer.start_log(
+            key="start",
+            class_name=self.class_name,
+            method_name=method_name,
+            db_name=db_name,
+            collection_name=collection_name,
+        )
+
+        try:
+            start = time.perf_counter()
+
+            buffer = BytesIO()
+
+            self.get_typed_dataframe(dataframe).to_parquet(
+                buffer, engine="pyarrow", index=False
+            )
+
+            self.upload_data(
+                data=buffer.getvalue(),
+                container_file_name=container_file_name,
+                container_name=container_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+            self.log_writer.log(
+                db_name=db_name,
+                collection_name=collection_name,
+                log_info=f"Uploaded dataframe as parquet to {container_file_name} file in {container_name} container, size is {buffer.tell()} bytes and took {time.perf_counter() - start:.3f} secs",
+            )
+
+            self.log_writer.start_log(
+                key="exit",
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+        except Exception as e:
+            self.log_writer.exception_log(
+                error=e,
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+    def read_parquet(
+        self,
+        file_name,
+        container_name,
+        db_name,
+        collection_name,
+        columns=None,
+        cache=False,
+    ):
+        method_name = self.read_parquet.__name__
+
+        self.log_writer.start_log(
+            key="start",
+            class_name=self.class_name,
+            method_name=method_name,
+            db_name=db_name,
+            collection_name=collection_name,
+        )
+
+        try:
+            start = time.perf_counter()
+
+            f_obj = self.get_object(
+                file_name=file_name,
+                container_name=container_name,
+                db_name=db_name,
+                collection_name=collection_name,
+                cache=cache,
+            )
+
+            content = self.read_object(
+                object=f_obj,
+                db_name=db_name,
+                collection_name=collection_name,
+                decode=False,
+            )
+
+            df = pd.read_parquet(BytesIO(content), engine="pyarrow", columns=columns)
+
+            self.log_writer.log(
+                db_name=db_name,
+                collection_name=collection_name,
+                log_info=f"Read {file_name} parquet file from {container_name} container, size is {len(content)} bytes and took {time.perf_counter() - start:.3f} secs",
+            )
+
+            self.log_writer.start_log(
+                key="exit",
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+            return df
+
+        except Exception as e:
+            self.log_writer.exception_log(
+                error=e,
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+    def get_export_file_name(self, file_name):
+        return os.path.splitext(file_name)[0] + "." + self.export_format
+
+    def upload_df_as_export(
+        self,
+        dataframe,
+        container_file_name,
+        container_name,
+        db_name,
+        collection_name,
+    ):
+        method_name = self.upload_df_as_export.__name__
+
+        try:
+            func = (
+                lambda: self.upload_df_as_parquet
+                if self.export_format == "parquet"
+                else self.upload_df_as_csv
+            )
+
+            export_file_name = self.get_export_file_name(container_file_name)
+
+            func()(
+                dataframe=dataframe,
+                container_file_name=export_file_name,
+                container_name=container_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+            return export_file_name
+
+        except Exception as e:
+            self.log_writer.exception_log(
+                error=e,
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+    def read_export(
+        self, file_name, container_name, db_name, collection_name, columns=None
+    ):
+        method_name = self.read_export.__name__
+
+        try:
+            func = (
+                lambda: self.read_parquet
+                if self.export_format == "parquet"
+                else self.read_csv
+            )
+
+            return func()(
+                file_name=self.get_export_file_name(file_name),
+                container_name=container_name,
+                db_name=db_name,
+                collection_name=collection_name,
+                columns=columns,
+                cache=True,
+            )
+
+        except Exception as e:
+            self.log_writer.exception_log(
+                error=e,
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+    def iter_csv_frames(self, dataframes):
+        columns = None
+
+        for df in dataframes:
+            header = columns is None
+
+            if header:
+                columns = df.columns
+
+            yield df.reindex(columns=columns).to_csv(
+                index=False, header=header
+            ).encode()
+
+    def get_parquet_data(self, dataframes):
+        """
+        Method Name :   get_parquet_data
+        Description :   This method is used for writing the dataframes as row groups of one parquet file, every
+                        chunk is cast to the schema fixed from the columns of the first chunk. The file is written
+                        to a spooled temp file, which moves to disk past export_file.spool_max_bytes. The bytes are
+                        returned while under the threshold, since the sdk gets the length of a file object with
+                        fileno, which would roll the spooled file over to disk
+        Output      :   The parquet bytes, or the parquet temp file positioned at the start
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        f = tempfile.SpooledTemporaryFile(max_size=self.export_spool_max_bytes)
+
+        schema, writer = None, None
+
+        try:
+            for df in dataframes:
+                if writer is None:
+                    schema = self.get_export_schema(df.columns)
+
+                    writer = pq.ParquetWriter(f, schema)
+
+                table = pa.Table.from_pandas(
+                    self.get_typed_dataframe(df.reindex(columns=schema.names)),
+                    schema=schema,
+                    preserve_index=False,
+                )
+
+                writer.write_table(table)
+
+            if writer is not None:
+                writer.close()
+
+        except Exception:
+            f.close()
+
+            raise
+
+        if not f._rolled:
+            data = f._file.getvalue()
+
+            f.close()
+
+            return data
+
+        f.seek(0)
+
+        return f
+
+    def upload_dfs_as_export(
+        self,
+        dataframes,
+        container_file_name,
+        container_name,
+        db_name,
+        collection_name,
+    ):
+        method_name = self.upload_dfs_as_export.__name__
+
+        self.log_writer.start_log(
+            key="start",
+            class_name=self.class_name,
+            method_name=method_name,
+            db_name=db_name,
+            collection_name=collection_name,
+        )
+
+        try:
+            dataframes = iter(dataframes)
+
+            first = next(dataframes, None)
+
+            if first is None:
+                return self.upload_df_as_export(
+                    dataframe=pd.DataFrame(),
+                    container_file_name=container_file_name,
+                    container_name=container_name,
+                    db_name=db_name,
+                    collection_name=collection_name,
+                )
+
+            start = time.perf_counter()
+
+            export_file_name = self.get_export_file_name(container_file_name)
+
+            frames = chain([first], dataframes)
+
+            func = (
+                lambda: self.get_parquet_data(frames)
+                if self.export_format == "parquet"
+                else self.iter_csv_frames(frames)
+            )
+
+            data = func()
+
+            try:
+                self.upload_data(
+                    data=data,
+                    container_file_name=export_file_name,
+                    container_name=container_name,
+                    db_name=db_name,
+                    collection_name=collection_name,
+                )
+
+            finally:
+                if hasattr(data, "close"):
+                    data.close()
+
+            self.log_writer.log(
+                db_name=db_name,
+                collection_name=collection_name,
+                log_info=f"Streamed dataframes as {self.export_format} to {export_file_name} file in {container_name} container in {time.perf_counter() - start:.3f} secs",
+            )
+
+            self.log_writer.start_log(
+                key="exit",
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+            return export_file_name
+
         except Exception as e:
             self.log_writer.exception_log(
                 error=e,
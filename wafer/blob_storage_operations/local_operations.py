@@ -0,0 +1,563 @@
+import csv
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+
+from wafer.blob_storage_operations.blob_operations import Blob_Operation
+
+_replace_lock = threading.Lock()
+
+
+class Local_Object:
+    """
+    Description :   This class is used for wrapping the content of a local file, so that it can be read
+                    like the downloader object returned by the blob container
+
+    Version     :   1.2
+    Revisions   :   moved to setup to cloud
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+        self.size = os.path.getsize(path)
+
+    def readall(self):
+        with open(self.path, "rb") as f:
+            return f.read()
+
+
+class Local_Storage_Operation(Blob_Operation):
+    """
+    Description :   This class is used for storage operations on a local directory, every container is a
+                    sub directory of storage.local_dir and every blob is a file in it. Only the storage primitives
+                    are implemented here, the rest of the operations are shared with Blob_Operation
+
+    Version     :   1.2
+    Revisions   :   moved to setup to cloud
+    """
+
+    def __init__(self):
+        super().__init__()
+
+        self.local_dir = self.config["storage"]["local_dir"]
+
+        self.tmp_dir = os.path.join(self.local_dir, ".tmp")
+
+    def get_connection_string(self):
+        return None
+
+    def get_local_path(self, file_name, container_name):
+        return os.path.join(self.local_dir, container_name, *file_name.split("/"))
+
+    def create_container(self, container_name, db_name, collection_name):
+        method_name = self.create_container.__name__
+
+        self.log_writer.start_log(
+            key="start",
+            class_name=self.class_name,
+            method_name=method_name,
+            db_name=db_name,
+            collection_name=collection_name,
+        )
+
+        try:
+            os.makedirs(os.path.join(self.local_dir, container_name), exist_ok=True)
+
+            self.log_writer.log(
+                db_name=db_name,
+                collection_name=collection_name,
+                log_info=f"{container_name} container directory is created in {self.local_dir}",
+            )
+
+            self.log_writer.start_log(
+                key="exit",
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+        except Exception as e:
+            self.log_writer.exception_log(
+                error=e,
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+    def delete_container(self, container_name, db_name, collection_name):
+        method_name = self.delete_container.__name__
+
+        self.log_writer.start_log(
+            key="start",
+            class_name=self.class_name,
+            method_name=method_name,
+            db_name=db_name,
+            collection_name=collection_name,
+        )
+
+        try:
+            shutil.rmtree(os.path.join(self.local_dir, container_name))
+
+            self.log_writer.log(
+                db_name=db_name,
+                collection_name=collection_name,
+                log_info=f"{container_name} container is deleted",
+            )
+
+            self.log_writer.start_log(
+                key="exit",
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+        except Exception as e:
+            self.log_writer.exception_log(
+                error=e,
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+    def load_file(self, file_name, container_name, db_name, collection_name):
+        method_name = self.load_file.__name__
+
+        try:
+            f = os.path.isfile(
+                self.get_local_path(file_name=file_name, container_name=container_name)
+            )
+
+            self.log_writer.log(
+                db_name=db_name,
+                collection_name=collection_name,
+                log_info=f"{file_name} file exists is {f}",
+            )
+
+            return f
+
+        except Exception as e:
+            self.log_writer.exception_log(
+                error=e,
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+    def get_local_etag(self, path):
+        stat = os.stat(path)
+
+        return f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+    def upload_data(
+        self,
+        data,
+        container_file_name,
+        container_name,
+        db_name,
+        collection_name,
+        replace=True,
+        etag=None,
+    ):
+        """
+        Method Name :   upload_data
+        Description :   This method is used for writing the data to a temp file in storage.local_dir/.tmp, outside
+                        the container directories, and moving it in place. The replace and etag checks are done
+                        together with the move under a process wide lock, across processes they are best effort
+        Output      :   The etag of the written file, None if the file exists and replace is False
+        On failure  :   Raise Exception
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        method_name = self.upload_data.__name__
+
+        self.log_writer.start_log(
+            key="start",
+            class_name=self.class_name,
+            method_name=method_name,
+            db_name=db_name,
+            collection_name=collection_name,
+        )
+
+        try:
+            dest_path = self.get_local_path(
+                file_name=container_file_name, container_name=container_name
+            )
+
+            os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+
+            os.makedirs(self.tmp_dir, exist_ok=True)
+
+            f = tempfile.NamedTemporaryFile(dir=self.tmp_dir, delete=False)
+
+            try:
+                with f:
+                    if isinstance(data, bytes):
+                        f.write(data)
+
+                    elif hasattr(data, "read"):
+                        shutil.copyfileobj(data, f)
+
+                    else:
+                        for chunk in data:
+                            f.write(chunk)
+
+                with _replace_lock:
+                    exists = os.path.isfile(dest_path)
+
+                    if etag is not None:
+                        if not exists or self.get_local_etag(dest_path) != etag:
+                            raise Exception(
+                                f"Precondition failed, {container_file_name} file in {container_name} container does not match etag {etag}"
+                            )
+
+                    elif exists and replace is False:
+                        self.log_writer.log(
+                            db_name=db_name,
+                            collection_name=collection_name,
+                            log_info=f"Replace option is set to {replace}, not replacing the {container_file_name} file in {container_name} container",
+                        )
+
+                        return None
+
+                    os.replace(f.name, dest_path)
+
+            finally:
+                if os.path.exists(f.name):
+                    os.remove(f.name)
+
+            self.log_writer.log(
+                db_name=db_name,
+                collection_name=collection_name,
+                log_info=f"Uploaded data to {container_name} container with name as {container_file_name} file, with replace as {replace} and etag precondition as {etag}",
+            )
+
+            self.log_writer.start_log(
+                key="exit",
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+            return self.get_local_etag(dest_path)
+
+        except Exception as e:
+            self.log_writer.exception_log(
+                error=e,
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+    def delete_file(self, file_name, container_name, db_name, collection_name):
+        method_name = self.delete_file.__name__
+
+        try:
+            os.remove(
+                self.get_local_path(file_name=file_name, container_name=container_name)
+            )
+
+            self.log_writer.log(
+                db_name=db_name,
+                collection_name=collection_name,
+                log_info=f"Deleted {file_name} file from {container_name} container",
+            )
+
+        except Exception as e:
+            self.log_writer.exception_log(
+                error=e,
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+    def get_object(
+        self, file_name, container_name, db_name, collection_name, cache=False
+    ):
+        method_name = self.get_object.__name__
+
+        try:
+            f = Local_Object(
+                self.get_local_path(file_name=file_name, container_name=container_name)
+            )
+
+            self.log_writer.log(
+                db_name=db_name,
+                collection_name=collection_name,
+                log_info=f"Got {file_name} info from {container_name} container",
+            )
+
+            return f
+
+        except Exception as e:
+            self.log_writer.exception_log(
+                error=e,
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+    def get_files_from_folder(
+        self, folder_name, container_name, db_name, collection_name
+    ):
+        method_name = self.get_files_from_folder.__name__
+
+        self.log_writer.start_log(
+            key="start",
+            class_name=self.class_name,
+            method_name=method_name,
+            db_name=db_name,
+            collection_name=collection_name,
+        )
+
+        try:
+            container_dir = Path(self.local_dir, container_name)
+
+            folder_dir = container_dir.joinpath(*folder_name.strip("/").split("/"))
+
+            f_name_lst = sorted(
+                p.relative_to(container_dir).as_posix()
+                for p in folder_dir.rglob("*")
+                if p.is_file()
+            )
+
+            self.log_writer.log(
+                db_name=db_name,
+                collection_name=collection_name,
+                log_info=f"Got files from {folder_name} folder from {container_name} container",
+            )
+
+            self.log_writer.start_log(
+                key="exit",
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+            return f_name_lst
+
+        except Exception as e:
+            self.log_writer.exception_log(
+                error=e,
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+    def set_content_md5(
+        self,
+        file_name,
+        container_name,
+        content_md5,
+        content_type,
+        db_name,
+        collection_name,
+    ):
+        pass
+
+    def get_local_md5(self, path):
+        digest = hashlib.md5()
+
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+
+        return digest.hexdigest()
+
+    def get_file_versions(self, folder_name, container_name, db_name, collection_name):
+        """
+        Method Name :   get_file_versions
+        Description :   This method is used for getting the md5 of every file in the folder, the local files are
+                        hashed since their mtime changes on every rewrite even when the content does not
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        method_name = self.get_file_versions.__name__
+
+        try:
+            files = self.get_files_from_folder(
+                folder_name=folder_name,
+                container_name=container_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+            return {
+                f: self.get_local_md5(
+                    self.get_local_path(file_name=f, container_name=container_name)
+                )
+                for f in files
+            }
+
+        except Exception as e:
+            self.log_writer.exception_log(
+                error=e,
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+    def read_csv_header(self, file_name, container_name, db_name, collection_name):
+        method_name = self.read_csv_header.__name__
+
+        try:
+            with open(
+                self.get_local_path(file_name=file_name, container_name=container_name),
+                newline="",
+            ) as f:
+                columns = next(csv.reader(f))
+
+            return columns
+
+        except Exception as e:
+            self.log_writer.exception_log(
+                error=e,
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+    def get_blob_url(self, file_name, container_name, db_name, collection_name):
+        method_name = self.get_blob_url.__name__
+
+        try:
+            path = self.get_local_path(
+                file_name=file_name, container_name=container_name
+            )
+
+            return Path(path).resolve().as_uri()
+
+        except Exception as e:
+            self.log_writer.exception_log(
+                error=e,
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+    def copy_data(
+        self,
+        from_file_name,
+        from_container_name,
+        to_file_name,
+        to_container_name,
+        db_name,
+        collection_name,
+    ):
+        method_name = self.copy_data.__name__
+
+        self.log_writer.start_log(
+            key="start",
+            class_name=self.class_name,
+            method_name=method_name,
+            db_name=db_name,
+            collection_name=collection_name,
+        )
+
+        try:
+            dest_path = self.get_local_path(
+                file_name=to_file_name, container_name=to_container_name
+            )
+
+            os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+
+            shutil.copyfile(
+                self.get_local_path(
+                    file_name=from_file_name, container_name=from_container_name
+                ),
+                dest_path,
+            )
+
+            self.log_writer.log(
+                db_name=db_name,
+                collection_name=collection_name,
+                log_info=f"Copied {from_file_name} file from {from_container_name} container to {to_file_name} file from {to_container_name}",
+            )
+
+            self.log_writer.start_log(
+                key="exit",
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+        except Exception as e:
+            self.log_writer.exception_log(
+                error=e,
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+    def delete_folder(self, folder_name, container_name, db_name, collection_name):
+        method_name = self.delete_folder.__name__
+
+        self.log_writer.start_log(
+            key="start",
+            class_name=self.class_name,
+            method_name=method_name,
+            db_name=db_name,
+            collection_name=collection_name,
+        )
+
+        try:
+            folder_dir = os.path.join(
+                self.local_dir, container_name, *folder_name.strip("/").split("/")
+            )
+
+            files = self.get_files_from_folder(
+                folder_name=folder_name,
+                container_name=container_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+            shutil.rmtree(folder_dir, ignore_errors=True)
+
+            summary = {"deleted": len(files), "failed": [], "batches": 1}
+
+            self.log_writer.log(
+                db_name=db_name,
+                collection_name=collection_name,
+                log_info=f"{folder_name} folder is deleted from {container_name} container, deleted {summary['deleted']} files",
+            )
+
+            self.log_writer.start_log(
+                key="exit",
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+            return summary
+
+        except Exception as e:
+            self.log_writer.exception_log(
+                error=e,
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
@@ -0,0 +1,28 @@
+from utils.read_params import read_params
+from wafer.blob_storage_operations.blob_operations import Blob_Operation
+from wafer.blob_storage_operations.local_operations import Local_Storage_Operation
+
+
+def get_storage_operation():
+    """
+    Method Name :   get_storage_operation
+    Description :   This method is used for getting the storage operation for the backend selected in
+                    params.yaml, azure for blob storage and local for a local directory
+
+    Version     :   1.2
+    Revisions   :   moved setup to cloud
+    """
+    config = read_params()
+
+    backend = config["storage"]["backend"]
+
+    if backend == "azure":
+        return Blob_Operation()
+
+    elif backend == "local":
+        return Local_Storage_Operation()
+
+    else:
+        raise Exception(
+            f"Unsupported storage backend {backend}, expected one of azure or local"
+        )
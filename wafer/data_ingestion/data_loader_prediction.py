@@ -1,6 +1,6 @@
 from utils.logger import App_Logger
 from utils.read_params import read_params
-from wafer.blob_storage_operations.blob_operations import Blob_Operation
+from wafer.blob_storage_operations.storage_operations import get_storage_operation
 
 
 class Data_Getter_Pred:
@@ -21,13 +21,13 @@ class Data_Getter_Pred:
 
         self.input_files_container = self.config["container"]["input_files"]
 
-        self.blob = Blob_Operation()
+        self.blob = get_storage_operation()
 
         self.log_writer = App_Logger()
 
         self.class_name = self.__class__.__name__
 
-    def get_data(self):
+    def get_data(self, columns=None):
         """
         Method Name :   get_data
         Description :   This method reads the data from the source
@@ -48,11 +48,12 @@ class Data_Getter_Pred:
         )
 
         try:
-            df = self.blob.read_csv(
+            df = self.blob.read_export(
                 file_name=self.pred_file,
                 container_name=self.input_files_container,
                 db_name=self.db_name,
                 collection_name=self.collection_name,
+                columns=columns,
             )
 
             self.log_writer.start_log(
@@ -1,6 +1,6 @@
 from utils.logger import App_Logger
 from utils.read_params import read_params
-from wafer.blob_storage_operations.blob_operations import Blob_Operation
+from wafer.blob_storage_operations.storage_operations import get_storage_operation
 
 
 class Data_Getter_Train:
@@ -21,7 +21,7 @@ class Data_Getter_Train:
 
         self.input_files_container = self.config["container"]["input_files"]
 
-        self.blob = Blob_Operation()
+        self.blob = get_storage_operation()
 
         self.log_writer = App_Logger()
 
@@ -48,7 +48,7 @@ class Data_Getter_Train:
         )
 
         try:
-            df = self.blob.read_csv(
+            df = self.blob.read_export(
                 file_name=self.train_csv_file,
                 container_name=self.input_files_container,
                 db_name=self.db_name,
@@ -1,9 +1,11 @@
+from io import BytesIO
+
 from kneed import KneeLocator
 from matplotlib import pyplot as plt
 from sklearn.cluster import KMeans
 from utils.logger import App_Logger
 from utils.read_params import read_params
-from wafer.blob_storage_operations.blob_operations import Blob_Operation
+from wafer.blob_storage_operations.storage_operations import get_storage_operation
 
 
 class KMeans_Clustering:
@@ -34,7 +36,7 @@ class KMeans_Clustering:
 
         self.kmeans_direction = self.config["kmeans_cluster"]["knee"]["direction"]
 
-        self.blob = Blob_Operation()
+        self.blob = get_storage_operation()
 
         self.elbow_plot_file = self.config["elbow_plot"]
 
@@ -83,16 +85,18 @@ class KMeans_Clustering:
 
             plt.ylabel("WCSS")
 
-            plt.savefig(self.elbow_plot_file)
+            plot_buffer = BytesIO()
+
+            plt.savefig(plot_buffer, format="png")
 
             self.log_writer.log(
                 db_name=self.db_name,
                 collection_name=self.collection_name,
-                log_info="Saved elbow_plot fig and local copy is created",
+                log_info="Saved elbow_plot fig to memory buffer",
             )
 
-            self.blob.upload_file(
-                local_file_name=self.elbow_plot_file,
+            self.blob.upload_data(
+                data=plot_buffer.getvalue(),
                 container_file_name=self.elbow_plot_file,
                 container_name=self.input_files_container,
                 db_name=self.db_name,
@@ -0,0 +1,161 @@
+import numpy as np
+from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.experimental import enable_iterative_imputer  # noqa: F401
+from sklearn.impute import IterativeImputer, KNNImputer, SimpleImputer
+from sklearn.metrics.pairwise import nan_euclidean_distances
+
+
+class Chunked_KNN_Imputer(BaseEstimator, TransformerMixin):
+    """
+    Description :   This class is used for imputing the missing values with the nearest neighbours, like
+                    KNNImputer, but with bounded cost. The neighbours are searched in a random subsample of
+                    at most max_donors rows of the fit data, and the distances are computed in blocks of rows
+                    which fit in max_memory_mb, so the cost grows linearly with the rows to impute. Values with
+                    no donor are filled with the median of the column
+
+    Version     :   1.2
+    Revisions   :   moved to setup to cloud
+    """
+
+    def __init__(
+        self,
+        n_neighbors=3,
+        weights="uniform",
+        max_donors=5000,
+        max_memory_mb=256,
+        random_state=None,
+    ):
+        self.n_neighbors = n_neighbors
+
+        self.weights = weights
+
+        self.max_donors = max_donors
+
+        self.max_memory_mb = max_memory_mb
+
+        self.random_state = random_state
+
+    def fit(self, X, y=None):
+        X = np.asarray(X, dtype=float)
+
+        rng = np.random.RandomState(self.random_state)
+
+        func = (
+            lambda: X[np.sort(rng.choice(len(X), self.max_donors, replace=False))]
+            if len(X) > self.max_donors
+            else X.copy()
+        )
+
+        self.donors_ = func()
+
+        self.donor_mask_ = ~np.isnan(self.donors_)
+
+        with np.errstate(all="ignore"):
+            medians = np.nanmedian(X, axis=0)
+
+        self.fill_values_ = np.where(np.isnan(medians), 0.0, medians)
+
+        self.n_features_in_ = X.shape[1]
+
+        return self
+
+    def get_block_rows(self):
+        block_bytes = self.max_memory_mb * 2**20
+
+        return max(1, int(block_bytes // (16 * max(len(self.donors_), 1))))
+
+    def transform(self, X):
+        X = np.array(X, dtype=float)
+
+        rows = np.flatnonzero(np.isnan(X).any(axis=1))
+
+        block_rows = self.get_block_rows()
+
+        for start in range(0, len(rows), block_rows):
+            idx = rows[start : start + block_rows]
+
+            block = X[idx]
+
+            dist = nan_euclidean_distances(block, self.donors_)
+
+            dist[np.isnan(dist)] = np.inf
+
+            for j in np.flatnonzero(np.isnan(block).any(axis=0)):
+                r = np.flatnonzero(np.isnan(block[:, j]))
+
+                k = min(self.n_neighbors, int(self.donor_mask_[:, j].sum()))
+
+                if k == 0:
+                    X[idx[r], j] = self.fill_values_[j]
+
+                    continue
+
+                d = np.where(self.donor_mask_[:, j], dist[r], np.inf)
+
+                nn = np.argpartition(d, k - 1, axis=1)[:, :k]
+
+                values = self.donors_[nn, j]
+
+                nn_dist = np.take_along_axis(d, nn, axis=1)
+
+                func = (
+                    lambda: 1 / np.maximum(nn_dist, 1e-12)
+                    if self.weights == "distance"
+                    else np.ones_like(nn_dist)
+                )
+
+                w = np.where(np.isinf(nn_dist), 0.0, func())
+
+                total = w.sum(axis=1)
+
+                filled = (np.nan_to_num(values) * w).sum(axis=1) / np.maximum(
+                    total, 1e-12
+                )
+
+                X[idx[r], j] = np.where(total > 0, filled, self.fill_values_[j])
+
+        return X
+
+
+def get_imputer(imputer_config):
+    """
+    Method Name :   get_imputer
+    Description :   This method is used for creating the unfitted imputer of imputer.strategy, which is one of
+                    knn (exact KNNImputer), chunked_knn (Chunked_KNN_Imputer), median or iterative
+    On failure  :   Raise Exception
+
+    Version     :   1.2
+    Revisions   :   moved setup to cloud
+    """
+    strategy = imputer_config["strategy"]
+
+    params = imputer_config.get(strategy, {})
+
+    if strategy == "knn":
+        return KNNImputer(
+            n_neighbors=params["n_neighbors"],
+            weights=params["weights"],
+            missing_values=np.nan,
+        )
+
+    if strategy == "chunked_knn":
+        return Chunked_KNN_Imputer(
+            n_neighbors=params["n_neighbors"],
+            weights=params["weights"],
+            max_donors=params["max_donors"],
+            max_memory_mb=params["max_memory_mb"],
+            random_state=params["random_state"],
+        )
+
+    if strategy == "median":
+        return SimpleImputer(strategy="median", missing_values=np.nan)
+
+    if strategy == "iterative":
+        return IterativeImputer(
+            max_iter=params["max_iter"],
+            n_nearest_features=params["n_nearest_features"],
+            initial_strategy="median",
+            random_state=params["random_state"],
+        )
+
+    raise Exception(f"{strategy} imputer strategy is not supported")
@@ -1,9 +1,11 @@
+import time
+
 import numpy as np
 import pandas as pd
-from sklearn.impute import KNNImputer
 from utils.logger import App_Logger
 from utils.read_params import read_params
-from wafer.blob_storage_operations.blob_operations import Blob_Operation
+from wafer.blob_storage_operations.storage_operations import get_storage_operation
+from wafer.data_preprocessing.imputation import get_imputer
 
 
 class Preprocessor:
@@ -21,15 +23,13 @@ class Preprocessor:
 
         self.config = read_params()
 
-        self.blob = Blob_Operation()
+        self.blob = get_storage_operation()
 
         self.input_files_container = self.config["container"]["input_files"]
 
         self.null_values_file = self.config["null_values_csv_file"]
 
-        self.knn_n_neighbors = self.config["knn_imputer"]["n_neighbors"]
-
-        self.knn_weights = self.config["knn_imputer"]["weights"]
+        self.imputer_config = self.config["imputer"]
 
         self.log_writer = App_Logger()
 
@@ -182,7 +182,6 @@ class Preprocessor:
 
                 self.blob.upload_df_as_csv(
                     dataframe=null_df,
-                    local_file_name=self.null_values_file,
                     container_file_name=self.null_values_file,
                     container_name=self.input_files_container,
                     db_name=self.db_name,
@@ -220,10 +219,64 @@ class Preprocessor:
                 collection_name=self.collection_name,
             )
 
-    def impute_missing_values(self, data):
+    def fit_imputer(self, data):
+        """
+        Method Name :   fit_imputer
+        Description :   This method is used for fitting the imputer of imputer.strategy on the data, so that it
+                        can be kept with the models and applied to the prediction data
+        Output      :   The fitted imputer
+        On failure  :   Raise Exception
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        method_name = self.fit_imputer.__name__
+
+        self.log_writer.start_log(
+            key="start",
+            class_name=self.class_name,
+            method_name=method_name,
+            db_name=self.db_name,
+            collection_name=self.collection_name,
+        )
+
+        try:
+            start = time.perf_counter()
+
+            imputer = get_imputer(self.imputer_config)
+
+            imputer.fit(data)
+
+            self.log_writer.log(
+                db_name=self.db_name,
+                collection_name=self.collection_name,
+                log_info=f"Fitted {self.imputer_config['strategy']} imputer on {data.shape} data in {time.perf_counter() - start:.2f} secs",
+            )
+
+            self.log_writer.start_log(
+                key="exit",
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=self.db_name,
+                collection_name=self.collection_name,
+            )
+
+            return imputer
+
+        except Exception as e:
+            self.log_writer.exception_log(
+                error=e,
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=self.db_name,
+                collection_name=self.collection_name,
+            )
+
+    def impute_missing_values(self, data, imputer=None):
         """
         Method Name :   impute_missing_values
-        Desrciption :   This method  replaces all the missing values in th dataframe using KNN imputer
+        Desrciption :   This method  replaces all the missing values in th dataframe using the imputer of
+                        imputer.strategy, a fitted imputer is only applied with transform
         Output      :   A dataframe which has all missing values imputed
         On failure  :   Raise Exception
         Written by  :   iNeuron Intelligence
@@ -244,13 +297,13 @@ class Preprocessor:
         self.data = data
 
         try:
-            imputer = KNNImputer(
-                n_neighbors=self.knn_n_neighbors,
-                weights=self.knn_weights,
-                missing_values=np.nan,
+            func = (
+                lambda: get_imputer(self.imputer_config).fit_transform(self.data)
+                if imputer is None
+                else imputer.transform(self.data)
             )
 
-            self.new_array = imputer.fit_transform(self.data)
+            self.new_array = func()
 
             self.new_data = pd.DataFrame(data=self.new_array, columns=self.data.columns)
 
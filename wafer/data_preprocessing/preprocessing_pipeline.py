@@ -0,0 +1,52 @@
+import pandas as pd
+
+
+class Preprocessing_Pipeline:
+    """
+    Description :   This class shall be used for keeping the preprocessing fitted during training, which is the
+                    list of feature columns, the columns dropped for zero standard deviation and the fitted
+                    imputer. It is saved and promoted along with the models, so that prediction only applies
+                    transform with the training state
+
+    Version     :   1.2
+    Revisions   :   moved to setup to cloud
+    """
+
+    def __init__(self, columns, dropped_columns, imputer):
+        self.columns = list(columns)
+
+        self.dropped_columns = list(dropped_columns)
+
+        self.imputer = imputer
+
+        self.features = [col for col in self.columns if col not in self.dropped_columns]
+
+    def transform(self, data):
+        """
+        Method Name :   transform
+        Description :   This method is used for selecting the training columns from the data, imputing the missing
+                        values with the fitted imputer and dropping the zero standard deviation columns
+        Output      :   A dataframe with the feature columns in the training order
+        On failure  :   Raise ValueError
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        missing_cols = [col for col in self.columns if col not in data.columns]
+
+        if len(missing_cols) > 0:
+            raise ValueError(f"Data is missing {missing_cols} columns")
+
+        X = data[self.columns].apply(pd.to_numeric, errors="coerce")
+
+        if X.isna().to_numpy().any():
+            if self.imputer is None:
+                raise ValueError(
+                    "Data has missing values and no imputer was fitted during training"
+                )
+
+            X = pd.DataFrame(
+                self.imputer.transform(X), columns=self.columns, index=X.index
+            )
+
+        return X[self.features]
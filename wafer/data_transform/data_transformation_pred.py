@@ -1,6 +1,6 @@
 from utils.logger import App_Logger
 from utils.read_params import read_params
-from wafer.blob_storage_operations.blob_operations import Blob_Operation
+from wafer.blob_storage_operations.storage_operations import get_storage_operation
 
 
 class Data_Transform_Pred:
@@ -18,7 +18,7 @@ class Data_Transform_Pred:
 
         self.class_name = self.__class__.__name__
 
-        self.blob = Blob_Operation()
+        self.blob = get_storage_operation()
 
         self.log_writer = App_Logger()
 
@@ -51,7 +51,7 @@ class Data_Transform_Pred:
         )
 
         try:
-            lst = self.blob.read_csv_from_folder(
+            lst = self.blob.iter_csv_from_folder(
                 folder_name=self.good_pred_data_dir,
                 container_name=self.pred_data_container,
                 db_name=self.db_name,
@@ -76,7 +76,6 @@ class Data_Transform_Pred:
 
                     self.blob.upload_df_as_csv(
                         dataframe=df,
-                        local_file_name=abs_f,
                         container_file_name=file,
                         container_name=self.pred_data_container,
                         db_name=self.db_name,
@@ -123,7 +122,7 @@ class Data_Transform_Pred:
         )
 
         try:
-            lst = self.blob.read_csv_from_folder(
+            lst = self.blob.iter_csv_from_folder(
                 folder_name=self.good_pred_data_dir,
                 container_name=self.pred_data_container,
                 db_name=self.db_name,
@@ -150,7 +149,6 @@ class Data_Transform_Pred:
 
                     self.blob.upload_df_as_csv(
                         dataframe=df,
-                        local_file_name=abs_f,
                         container_file_name=self.pred_data_container,
                         container_name=self.pred_data_container,
                         db_name=self.db_name,
@@ -1,6 +1,6 @@
 from utils.logger import App_Logger
 from utils.read_params import read_params
-from wafer.blob_storage_operations.blob_operations import Blob_Operation
+from wafer.blob_storage_operations.storage_operations import get_storage_operation
 
 
 class Data_Transform_Train:
@@ -18,7 +18,7 @@ class Data_Transform_Train:
 
         self.class_name = self.__class__.__name__
 
-        self.blob = Blob_Operation()
+        self.blob = get_storage_operation()
 
         self.log_writer = App_Logger()
 
@@ -30,6 +30,23 @@ class Data_Transform_Train:
 
         self.train_data_container = self.config["container"]["train_data"]
 
+    def transform_dataframe(self, df):
+        """
+        Method Name :   transform_dataframe
+        Description :   This method applies the rename of the target column, the replacement of missing values
+                        with "NULL" and the strip of the Wafer prefix to a single dataframe in memory
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        df = df.rename(columns={"Good/Bad": "Output"})
+
+        df = df.fillna("NULL")
+
+        df["Wafer"] = df["Wafer"].str[6:]
+
+        return df
+
     def rename_target_column(self):
         """
         Method Name :   rename_target_column
@@ -51,7 +68,7 @@ class Data_Transform_Train:
         )
 
         try:
-            lst = self.blob.read_csv_from_folder(
+            lst = self.blob.iter_csv_from_folder(
                 folder_name=self.good_train_data_dir,
                 container_name=self.train_data_container,
                 db_name=self.db_name,
@@ -76,7 +93,6 @@ class Data_Transform_Train:
 
                     self.blob.upload_df_as_csv(
                         dataframe=df,
-                        local_file_name=abs_f,
                         container_file_name=file,
                         container_name=self.train_data_container,
                         db_name=self.db_name,
@@ -123,7 +139,7 @@ class Data_Transform_Train:
         )
 
         try:
-            lst = self.blob.read_csv_from_folder(
+            lst = self.blob.iter_csv_from_folder(
                 folder_name=self.good_train_data_dir,
                 container_name=self.train_data_container,
                 db_name=self.db_name,
@@ -150,7 +166,6 @@ class Data_Transform_Train:
 
                     self.blob.upload_df_as_csv(
                         dataframe=df,
-                        local_file_name=abs_f,
                         container_file_name=self.train_data_container,
                         container_name=self.train_data_container,
                         db_name=self.db_name,
@@ -1,6 +1,9 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
 from utils.logger import App_Logger
 from utils.read_params import read_params
-from wafer.blob_storage_operations.blob_operations import Blob_Operation
+from wafer.blob_storage_operations.storage_operations import get_storage_operation
 from wafer.mongo_db_operations.mongo_operations import MongoDB_Operation
 
 
@@ -31,16 +34,21 @@ class DB_Operation_Pred:
 
         self.pred_export_csv_log = self.config["pred_db_log"]["export_csv"]
 
-        self.blob = Blob_Operation()
+        self.blob = get_storage_operation()
 
         self.mongo = MongoDB_Operation()
 
+        self.insert_max_workers = self.config["mongodb"]["insert"]["max_workers"]
+
+        self.stream_export = self.config["mongodb"]["export"]["stream"]
+
         self.log_writer = App_Logger()
 
     def insert_good_data_as_record(self, good_data_db_name, good_data_collection_name):
         """
         Method Name :   insert_good_data_as_record
-        Description :   This method inserts the good data in MongoDB as collection
+        Description :   This method inserts the good data in MongoDB as collection, the files are inserted
+                        in parallel by mongodb.insert.max_workers threads
 
         Version     :   1.2
         Revisions   :   moved setup to cloud
@@ -56,33 +64,46 @@ class DB_Operation_Pred:
         )
 
         try:
-            lst = self.blob.read_csv_from_folder(
+            lst = self.blob.iter_csv_from_folder(
                 folder_name=self.good_data_pred_dir,
                 container_name=self.pred_data_container,
                 db_name=self.db_name,
                 collection_name=self.pred_db_insert_log,
             )
 
-            for f in lst:
-                df = f[1]
+            start = time.perf_counter()
 
-                file = f[2]
+            rows, pending = 0, set()
 
-                if file.endswith(".csv"):
-                    self.mongo.insert_dataframe_as_record(
-                        data_frame=df,
-                        db_name=good_data_db_name,
-                        collection_name=good_data_collection_name,
-                    )
+            with ThreadPoolExecutor(max_workers=self.insert_max_workers) as executor:
+                for df, file, abs_f in lst:
+                    if abs_f.endswith(".csv"):
+                        if len(pending) >= self.insert_max_workers:
+                            done, pending = wait(pending, return_when=FIRST_COMPLETED)
 
-                else:
-                    pass
+                            rows += sum(f.result() for f in done)
 
-                self.log_writer.log(
-                    db_name=self.db_name,
-                    collection_name=self.pred_db_insert_log,
-                    log_info="Inserted dataframe as collection record in mongodb",
-                )
+                        pending.add(
+                            executor.submit(
+                                self.mongo.insert_dataframe_as_record,
+                                data_frame=df,
+                                db_name=good_data_db_name,
+                                collection_name=good_data_collection_name,
+                            )
+                        )
+
+                    else:
+                        pass
+
+                rows += sum(f.result() for f in wait(pending).done)
+
+            secs = time.perf_counter() - start
+
+            self.log_writer.log(
+                db_name=self.db_name,
+                collection_name=self.pred_db_insert_log,
+                log_info=f"Inserted {rows} records as collection records in mongodb in {secs:.3f} secs, throughput is {rows / max(secs, 1e-9):.0f} records/sec",
+            )
 
             self.log_writer.start_log(
                 key="exit",
@@ -105,7 +126,7 @@ class DB_Operation_Pred:
         """
         Method Name :   export_collection_to_csv
 
-        Description :   This method extracts the inserted data to csv file, which will be used for preding
+        Description :   This method extracts the inserted data to the export file, in the export_file format, which will be used for preding
         Version     :   1.2
         Revisions   :   moved setup to cloud
         """
@@ -120,19 +141,33 @@ class DB_Operation_Pred:
         )
 
         try:
-            df = self.mongo.get_collection_as_dataframe(
-                db_name=good_data_db_name,
-                collection_name=good_data_collection_name,
-            )
+            if self.stream_export is True:
+                dfs = self.mongo.iter_collection_as_dataframes(
+                    db_name=good_data_db_name,
+                    collection_name=good_data_collection_name,
+                )
 
-            self.blob.upload_df_as_csv(
-                dataframe=df,
-                local_file_name=self.pred_export_csv_file,
-                container_file_name=self.pred_export_csv_file,
-                container_name=self.input_files_container,
-                db_name=self.db_name,
-                collection_name=self.pred_export_csv_log,
-            )
+                self.blob.upload_dfs_as_export(
+                    dataframes=dfs,
+                    container_file_name=self.pred_export_csv_file,
+                    container_name=self.input_files_container,
+                    db_name=self.db_name,
+                    collection_name=self.pred_export_csv_log,
+                )
+
+            else:
+                df = self.mongo.get_collection_as_dataframe(
+                    db_name=good_data_db_name,
+                    collection_name=good_data_collection_name,
+                )
+
+                self.blob.upload_df_as_export(
+                    dataframe=df,
+                    container_file_name=self.pred_export_csv_file,
+                    container_name=self.input_files_container,
+                    db_name=self.db_name,
+                    collection_name=self.pred_export_csv_log,
+                )
 
             self.log_writer.start_log(
                 key="exit",
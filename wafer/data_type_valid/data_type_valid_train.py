@@ -1,6 +1,10 @@
+import time
+from datetime import datetime
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
 from utils.logger import App_Logger
 from utils.read_params import read_params
-from wafer.blob_storage_operations.blob_operations import Blob_Operation
+from wafer.blob_storage_operations.storage_operations import get_storage_operation
 from wafer.mongo_db_operations.mongo_operations import MongoDB_Operation
 
 
@@ -31,16 +35,64 @@ class DB_Operation_Train:
 
         self.train_export_csv_log = self.config["train_db_log"]["export_csv"]
 
-        self.blob = Blob_Operation()
+        self.blob = get_storage_operation()
 
         self.mongo = MongoDB_Operation()
 
+        self.insert_max_workers = self.config["mongodb"]["insert"]["max_workers"]
+
+        self.stream_export = self.config["mongodb"]["export"]["stream"]
+
+        self.upsert_key = self.config["mongodb"]["insert"]["upsert_key"]
+
+        self.manifest_collection = self.config["mongodb"]["insert"][
+            "manifest_collection"
+        ]
+
         self.log_writer = App_Logger()
 
+    def load_file_as_record(
+        self, df, file, version, good_data_db_name, good_data_collection_name
+    ):
+        """
+        Method Name :   load_file_as_record
+        Description :   This method upserts the records of a single good data file and then records the file with
+                        its blob version in the manifest collection
+        Output      :   Number of upserted records
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        rows = self.mongo.upsert_dataframe_as_record(
+            data_frame=df,
+            db_name=good_data_db_name,
+            collection_name=good_data_collection_name,
+            key=self.upsert_key,
+        )
+
+        self.mongo.upsert_record(
+            db_name=good_data_db_name,
+            collection_name=self.manifest_collection,
+            query={"collection": good_data_collection_name, "file": file},
+            data={
+                "collection": good_data_collection_name,
+                "file": file,
+                "version": version,
+                "rows": rows,
+                "loaded_at": datetime.utcnow(),
+            },
+        )
+
+        return rows
+
     def insert_good_data_as_record(self, good_data_db_name, good_data_collection_name):
         """
         Method Name :   insert_good_data_as_record
-        Description :   This method inserts the good data in MongoDB as collection
+        Description :   This method inserts the good data in MongoDB as collection, the files are inserted
+                        in parallel by mongodb.insert.max_workers threads. Files already loaded with the same
+                        blob version (content md5 or etag) are skipped from the listing, without downloading them.
+                        The records are upserted on mongodb.insert.upsert_key, which assumes that wafer ids are
+                        unique across files, a row of a later file with the same wafer id replaces the earlier one
 
         Version     :   1.2
         Revisions   :   moved setup to cloud
@@ -56,33 +108,84 @@ class DB_Operation_Train:
         )
 
         try:
-            lst = self.blob.read_csv_from_folder(
+            start = time.perf_counter()
+
+            loaded = {
+                (r["file"], r.get("version"))
+                for r in self.mongo.get_records(
+                    db_name=good_data_db_name,
+                    collection_name=self.manifest_collection,
+                    query={"collection": good_data_collection_name},
+                    projection={"_id": 0, "file": 1, "version": 1},
+                )
+            }
+
+            versions = self.blob.get_file_versions(
                 folder_name=self.good_data_train_dir,
                 container_name=self.train_data_container,
                 db_name=self.db_name,
                 collection_name=self.train_db_insert_log,
             )
 
-            for f in lst:
-                df = f[1]
+            files = [f for f, version in versions.items() if (f, version) not in loaded]
 
-                file = f[2]
+            skipped = len(versions) - len(files)
 
-                if file.endswith(".csv"):
-                    self.mongo.insert_dataframe_as_record(
-                        data_frame=df,
-                        db_name=good_data_db_name,
-                        collection_name=good_data_collection_name,
+            lst = self.blob.iter_csv_files(
+                files=files,
+                container_name=self.train_data_container,
+                db_name=self.db_name,
+                collection_name=self.train_db_insert_log,
+            )
+
+            for collection_name, keys in (
+                (good_data_collection_name, [self.upsert_key]),
+                (self.manifest_collection, ["collection", "file"]),
+            ):
+                if not self.mongo.create_unique_index(
+                    db_name=good_data_db_name,
+                    collection_name=collection_name,
+                    keys=keys,
+                ):
+                    self.log_writer.log(
+                        db_name=self.db_name,
+                        collection_name=self.train_db_insert_log,
+                        log_info=f"Could not create unique index on {keys} in {collection_name} collection, it has duplicate records",
                     )
 
-                else:
-                    pass
+            rows, pending = 0, set()
 
-                self.log_writer.log(
-                    db_name=self.db_name,
-                    collection_name=self.train_db_insert_log,
-                    log_info="Inserted dataframe as collection record in mongodb",
-                )
+            with ThreadPoolExecutor(max_workers=self.insert_max_workers) as executor:
+                for df, file, abs_f in lst:
+                    if abs_f.endswith(".csv"):
+                        if len(pending) >= self.insert_max_workers:
+                            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                            rows += sum(f.result() for f in done)
+
+                        pending.add(
+                            executor.submit(
+                                self.load_file_as_record,
+                                df=df,
+                                file=file,
+                                version=versions[file],
+                                good_data_db_name=good_data_db_name,
+                                good_data_collection_name=good_data_collection_name,
+                            )
+                        )
+
+                    else:
+                        pass
+
+                rows += sum(f.result() for f in wait(pending).done)
+
+            secs = time.perf_counter() - start
+
+            self.log_writer.log(
+                db_name=self.db_name,
+                collection_name=self.train_db_insert_log,
+                log_info=f"Upserted {rows} records as collection records in mongodb in {secs:.3f} secs, throughput is {rows / max(secs, 1e-9):.0f} records/sec, skipped {skipped} already loaded files",
+            )
 
             self.log_writer.start_log(
                 key="exit",
@@ -105,7 +208,7 @@ class DB_Operation_Train:
         """
         Method Name :   export_collection_to_csv
 
-        Description :   This method extracts the inserted data to csv file, which will be used for training
+        Description :   This method extracts the inserted data to the export file, in the export_file format, which will be used for training
         Version     :   1.2
         Revisions   :   moved setup to cloud
         """
@@ -120,19 +223,33 @@ class DB_Operation_Train:
         )
 
         try:
-            df = self.mongo.get_collection_as_dataframe(
-                db_name=good_data_db_name,
-                collection_name=good_data_collection_name,
-            )
+            if self.stream_export is True:
+                dfs = self.mongo.iter_collection_as_dataframes(
+                    db_name=good_data_db_name,
+                    collection_name=good_data_collection_name,
+                )
 
-            self.blob.upload_df_as_csv(
-                dataframe=df,
-                local_file_name=self.train_export_csv_file,
-                container_file_name=self.train_export_csv_file,
-                container_name=self.input_files_container,
-                db_name=self.db_name,
-                collection_name=self.train_export_csv_log,
-            )
+                self.blob.upload_dfs_as_export(
+                    dataframes=dfs,
+                    container_file_name=self.train_export_csv_file,
+                    container_name=self.input_files_container,
+                    db_name=self.db_name,
+                    collection_name=self.train_export_csv_log,
+                )
+
+            else:
+                df = self.mongo.get_collection_as_dataframe(
+                    db_name=good_data_db_name,
+                    collection_name=good_data_collection_name,
+                )
+
+                self.blob.upload_df_as_export(
+                    dataframe=df,
+                    container_file_name=self.train_export_csv_file,
+                    container_name=self.input_files_container,
+                    db_name=self.db_name,
+                    collection_name=self.train_export_csv_log,
+                )
 
             self.log_writer.start_log(
                 key="exit",
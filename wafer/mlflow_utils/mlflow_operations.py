@@ -5,7 +5,7 @@ from mlflow.tracking import MlflowClient
 from utils.logger import App_Logger
 from utils.model_utils import Model_Utils
 from utils.read_params import read_params
-from wafer.blob_storage_operations.blob_operations import Blob_Operation
+from wafer.blob_storage_operations.storage_operations import get_storage_operation
 
 
 class MLFlow_Operation:
@@ -25,7 +25,7 @@ class MLFlow_Operation:
 
         self.model_utils = Model_Utils()
 
-        self.blob = Blob_Operation()
+        self.blob = get_storage_operation()
 
         self.db_name = db_name
 
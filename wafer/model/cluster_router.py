@@ -0,0 +1,67 @@
+import numpy as np
+
+
+class Cluster_Router:
+    """
+    Description :   This class is used for routing the rows to the model of their cluster. The rows are
+                    partitioned once by the kmeans label with index arrays, each partition is scored only by
+                    its own model and the predictions are scattered back into one array in the original order
+
+    Version     :   1.2
+    Revisions   :   moved to setup to cloud
+    """
+
+    def __init__(self, kmeans, models):
+        self.kmeans = kmeans
+
+        self.models = models
+
+    def partition(self, clusters):
+        """
+        Method Name :   partition
+        Description :   This method is used for getting the row indices of every cluster label, with a single
+                        stable sort of the labels
+        Output      :   A list of (label, indices) pairs
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        order = np.argsort(clusters, kind="stable")
+
+        labels, starts = np.unique(clusters[order], return_index=True)
+
+        return list(zip(labels, np.split(order, starts[1:])))
+
+    def predict(self, features):
+        """
+        Method Name :   predict
+        Description :   This method is used for predicting the cluster of every row and then scoring every
+                        partition with the model of its cluster
+        Output      :   The cluster labels and the predictions, both in the order of the rows
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        clusters = np.asarray(self.kmeans.predict(features))
+
+        take = (
+            lambda idx: features.iloc[idx]
+            if hasattr(features, "iloc")
+            else features[idx]
+        )
+
+        parts = [
+            (idx, np.asarray(self.models[label].predict(take(idx))))
+            for label, idx in self.partition(clusters)
+        ]
+
+        dtypes = [part.dtype for _, part in parts]
+
+        predictions = np.empty(
+            len(clusters), dtype=np.result_type(*dtypes) if dtypes else float
+        )
+
+        for idx, part in parts:
+            predictions[idx] = part
+
+        return clusters, predictions
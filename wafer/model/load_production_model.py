@@ -1,6 +1,11 @@
+import json
+import uuid
+from datetime import datetime
+
 from utils.logger import App_Logger
 from utils.read_params import read_params
-from wafer.blob_storage_operations.blob_operations import Blob_Operation
+from wafer.blob_storage_operations.storage_operations import get_storage_operation
+from wafer.data_preprocessing.preprocessing_pipeline import Preprocessing_Pipeline
 from wafer.mlflow_utils.mlflow_operations import MLFlow_Operations
 
 
@@ -23,7 +28,7 @@ class Load_Prod_Model:
 
         self.db_name = self.config["db_log"]["train_db_log"]
 
-        self.model_container = self.config["container"]["model"]
+        self.model_container = self.config["container"]["wafer_model_container"]
 
         self.load_prod_model_log = self.config["train_db_log"]["Load_Prod_Model"]
 
@@ -31,9 +36,17 @@ class Load_Prod_Model:
 
         self.stag_model_dir = self.config["models_dir"]["stag"]
 
+        self.trained_model_dir = self.config["models_dir"]["trained"]
+
+        self.model_save_format = self.config["model_utils"]["save_format"]
+
         self.exp_name = self.config["mlflow_config"]["experiment_name"]
 
-        self.blob = Blob_Operation()
+        self.marker_file = (
+            self.prod_model_dir + "/" + self.config["model_registry"]["marker_file"]
+        )
+
+        self.blob = get_storage_operation()
 
         self.mlflow_op = MLFlow_Operations(table_name=self.load_prod_model_log)
 
@@ -41,7 +54,8 @@ class Load_Prod_Model:
         """
         Method Name :   load_production_model
         Description :   This method is responsible for moving the models from the trained models dir to
-                        prod models dir and stag models dir based on the metrics of the cluster
+                        prod models dir and stag models dir based on the metrics of the cluster, and then
+                        writing the version marker which the model registry reloads the prod models on
 
         Version     :   1.2
         Revisions   :   moved setup to cloud
@@ -205,6 +219,41 @@ run_number  metrics.XGBoost0-best_score metrics.RandomForest1-best_score metrics
                 log_info="Transitioning of models based on scores successfully done",
             )
 
+            preprocessing_file = (
+                Preprocessing_Pipeline.__name__ + self.model_save_format
+            )
+
+            self.blob.copy_data(
+                from_file_name=self.trained_model_dir + "/" + preprocessing_file,
+                from_container_name=self.model_container,
+                to_file_name=self.prod_model_dir + "/" + preprocessing_file,
+                to_container_name=self.model_container,
+                db_name=self.db_name,
+                collection_name=self.load_prod_model_log,
+            )
+
+            marker = {
+                "version": uuid.uuid4().hex,
+                "promoted_at": datetime.utcnow().isoformat(),
+                "kmeans": "KMeans",
+                "preprocessing": Preprocessing_Pipeline.__name__,
+                "clusters": {str(i): mn for i, mn in enumerate(top_mn_lst)},
+            }
+
+            self.blob.upload_data(
+                data=json.dumps(marker).encode(),
+                container_file_name=self.marker_file,
+                container_name=self.model_container,
+                db_name=self.db_name,
+                collection_name=self.load_prod_model_log,
+            )
+
+            self.log_writer.log(
+                db_name=self.db_name,
+                collection_name=self.load_prod_model_log,
+                log_info=f"Wrote {marker['version']} version marker of production models to {self.marker_file} file",
+            )
+
             self.log_writer.start_log(
                 key="exit",
                 class_name=self.class_name,
@@ -0,0 +1,169 @@
+import threading
+import time
+
+from utils.logger import App_Logger
+from utils.read_params import read_params
+from wafer.blob_storage_operations.storage_operations import get_storage_operation
+
+
+class Model_Registry:
+    """
+    Description :   This class is used for keeping the production model set in memory for the process. The
+                    version marker written by Load_Prod_Model is checked at most every check_interval secs,
+                    through the blob cache so that an unchanged marker costs a 304, and when the version
+                    changes the new model set is loaded and swapped in as a whole
+
+    Version     :   1.2
+    Revisions   :   moved to setup to cloud
+    """
+
+    def __init__(self):
+        self.config = read_params()
+
+        self.class_name = self.__class__.__name__
+
+        self.log_writer = App_Logger()
+
+        self.blob = get_storage_operation()
+
+        self.model_container = self.config["container"]["wafer_model_container"]
+
+        self.prod_model_dir = self.config["models_dir"]["prod"]
+
+        self.marker_file = (
+            self.prod_model_dir + "/" + self.config["model_registry"]["marker_file"]
+        )
+
+        self.check_interval = self.config["model_registry"]["check_interval"]
+
+        self.lock = threading.Lock()
+
+        self.state = (None, None)
+
+    def load_model_set(self, marker, db_name, collection_name):
+        """
+        Method Name :   load_model_set
+        Description :   This method is used for loading the preprocessing pipeline, the kmeans model and the model
+                        of every cluster listed in the version marker
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        method_name = self.load_model_set.__name__
+
+        self.log_writer.start_log(
+            key="start",
+            class_name=self.class_name,
+            method_name=method_name,
+            db_name=db_name,
+            collection_name=collection_name,
+        )
+
+        try:
+            load = lambda model_name: self.blob.load_model(
+                model_name=model_name,
+                container_name=self.model_container,
+                model_dir=self.prod_model_dir,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+            model_set = {
+                "version": marker["version"],
+                "kmeans": load(marker["kmeans"]),
+                "preprocessing": load(marker["preprocessing"]),
+                "models": {
+                    int(cluster): load(model_name)
+                    for cluster, model_name in marker["clusters"].items()
+                },
+            }
+
+            self.log_writer.log(
+                db_name=db_name,
+                collection_name=collection_name,
+                log_info=f"Loaded {marker['version']} version of production models with {len(model_set['models'])} cluster models",
+            )
+
+            self.log_writer.start_log(
+                key="exit",
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+            return model_set
+
+        except Exception as e:
+            self.log_writer.exception_log(
+                error=e,
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+    def get_model_set(self, db_name, collection_name):
+        """
+        Method Name :   get_model_set
+        Description :   This method is used for getting the current production model set, callers should keep the
+                        returned set for the whole request so that a reload does not mix two versions. The set
+                        and the time of its check are published together as one tuple for the unlocked fast path
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        model_set, last_check = self.state
+
+        if (
+            model_set is not None
+            and time.monotonic() - last_check < self.check_interval
+        ):
+            return model_set
+
+        with self.lock:
+            model_set, last_check = self.state
+
+            if (
+                model_set is not None
+                and time.monotonic() - last_check < self.check_interval
+            ):
+                return model_set
+
+            marker = self.blob.read_json(
+                file_name=self.marker_file,
+                container_name=self.model_container,
+                db_name=db_name,
+                collection_name=collection_name,
+            )
+
+            if model_set is None or model_set["version"] != marker["version"]:
+                model_set = self.load_model_set(
+                    marker=marker, db_name=db_name, collection_name=collection_name
+                )
+
+            self.state = (model_set, time.monotonic())
+
+            return model_set
+
+
+_model_registry = None
+
+_model_registry_lock = threading.Lock()
+
+
+def get_model_registry():
+    """
+    Method Name :   get_model_registry
+    Description :   This method is used for getting the process wide model registry, which is created on first use
+
+    Version     :   1.2
+    Revisions   :   moved setup to cloud
+    """
+    global _model_registry
+
+    with _model_registry_lock:
+        if _model_registry is None:
+            _model_registry = Model_Registry()
+
+        return _model_registry
@@ -0,0 +1,241 @@
+import json
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+import pandas as pd
+import pyarrow as pa
+from utils.logger import App_Logger
+from utils.read_params import read_params
+from wafer.model.cluster_router import Cluster_Router
+from wafer.model.model_registry import get_model_registry
+
+
+class Micro_Batcher:
+    """
+    Description :   This class is used for collecting the requests of concurrent callers into one batch, which
+                    is handed to func once the batch has max_batch_rows rows or the first request has waited
+                    max_wait_ms. The requests of a batch are grouped by the context they were submitted with,
+                    func gets the concatenated dataframe and the context of each group and returns one result
+                    per row, which are split back to the futures of the callers
+
+    Version     :   1.2
+    Revisions   :   moved to setup to cloud
+    """
+
+    def __init__(self, func, max_batch_rows, max_wait_ms):
+        self.func = func
+
+        self.max_batch_rows = max_batch_rows
+
+        self.max_wait = max_wait_ms / 1000
+
+        self.requests = queue.Queue()
+
+        self.thread = threading.Thread(
+            target=self.run, name="micro-batcher", daemon=True
+        )
+
+        self.thread.start()
+
+    def submit(self, data, context=None):
+        """
+        Method Name :   submit
+        Description :   This method is used for queueing the rows of a request, only requests with the same
+                        context object are scored together
+        Output      :   A future with the results for the rows
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        future = Future()
+
+        self.requests.put((data, context, future))
+
+        return future
+
+    def get_batch(self):
+        batch = [self.requests.get()]
+
+        rows = len(batch[0][0])
+
+        deadline = time.monotonic() + self.max_wait
+
+        while rows < self.max_batch_rows:
+            timeout = deadline - time.monotonic()
+
+            if timeout <= 0:
+                break
+
+            try:
+                batch.append(self.requests.get(timeout=timeout))
+
+            except queue.Empty:
+                break
+
+            rows += len(batch[-1][0])
+
+        return batch
+
+    def run_group(self, context, group):
+        try:
+            results = self.func(
+                pd.concat([data for data, _ in group], ignore_index=True), context
+            )
+
+            offset = 0
+
+            for data, future in group:
+                future.set_result(results[offset : offset + len(data)])
+
+                offset += len(data)
+
+        except Exception as e:
+            for _, future in group:
+                future.set_exception(e)
+
+    def run(self):
+        while True:
+            groups = {}
+
+            for data, context, future in self.get_batch():
+                groups.setdefault(id(context), (context, []))[1].append((data, future))
+
+            for context, group in groups.values():
+                self.run_group(context, group)
+
+
+class Online_Prediction:
+    """
+    Description :   This class shall be used for scoring wafer rows sent to the api with the production models
+                    held by the model registry, without going through the blob and mongodb batch pipeline
+
+    Version     :   1.2
+    Revisions   :   moved to setup to cloud
+    """
+
+    def __init__(self):
+        self.config = read_params()
+
+        self.class_name = self.__class__.__name__
+
+        self.db_name = self.config["db_log"]["db_pred_log"]
+
+        self.online_pred_log = self.config["pred_db_log"]["online_pred"]
+
+        self.log_writer = App_Logger()
+
+        self.model_registry = get_model_registry()
+
+        self.batcher = Micro_Batcher(
+            func=self.predict_dataframe,
+            max_batch_rows=self.config["online_prediction"]["max_batch_rows"],
+            max_wait_ms=self.config["online_prediction"]["max_wait_ms"],
+        )
+
+    def get_dataframe(self, body, content_type):
+        """
+        Method Name :   get_dataframe
+        Description :   This method is used for reading the request body as a dataframe, the body is either an
+                        arrow ipc stream or file, or json with a single row, a list of rows or {"rows": [...]}
+        On failure  :   Raise ValueError
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        if content_type.startswith("application/vnd.apache.arrow.stream"):
+            return pa.ipc.open_stream(body).read_pandas()
+
+        if content_type.startswith("application/vnd.apache.arrow.file"):
+            return pa.ipc.open_file(body).read_pandas()
+
+        rows = json.loads(body)
+
+        if isinstance(rows, dict):
+            rows = rows.get("rows", [rows])
+
+        if not isinstance(rows, list) or len(rows) == 0:
+            raise ValueError("Request has no rows to predict")
+
+        return pd.DataFrame.from_records(rows)
+
+    def predict_dataframe(self, data, model_set):
+        """
+        Method Name :   predict_dataframe
+        Description :   This method is used for scoring a micro batch with the model set which preprocessed its
+                        rows, each row is routed by the kmeans model to the model of its cluster
+        Output      :   An array of predictions in the order of the rows
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        method_name = self.predict_dataframe.__name__
+
+        try:
+            start = time.perf_counter()
+
+            router = Cluster_Router(
+                kmeans=model_set["kmeans"], models=model_set["models"]
+            )
+
+            _, predictions = router.predict(data)
+
+            self.log_writer.log(
+                db_name=self.db_name,
+                collection_name=self.online_pred_log,
+                log_info=f"Predicted {len(data)} rows with {model_set['version']} version of models in {time.perf_counter() - start:.4f} secs",
+            )
+
+            return predictions
+
+        except Exception as e:
+            self.log_writer.exception_log(
+                error=e,
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=self.db_name,
+                collection_name=self.online_pred_log,
+            )
+
+    def predict(self, data):
+        """
+        Method Name :   predict
+        Description :   This method is used for applying the training preprocessing to the rows of a request and
+                        queueing them for the next micro batch, along with the model set used so that a reload
+                        in between does not score them with another version
+        Output      :   A future with the predictions of the rows
+        On failure  :   Raise ValueError
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        model_set = self.model_registry.get_model_set(
+            db_name=self.db_name, collection_name=self.online_pred_log
+        )
+
+        features = model_set["preprocessing"].transform(data)
+
+        return self.batcher.submit(features, context=model_set)
+
+
+_online_prediction = None
+
+_online_prediction_lock = threading.Lock()
+
+
+def get_online_prediction():
+    """
+    Method Name :   get_online_prediction
+    Description :   This method is used for getting the process wide online prediction, which is created on first use
+
+    Version     :   1.2
+    Revisions   :   moved setup to cloud
+    """
+    global _online_prediction
+
+    with _online_prediction_lock:
+        if _online_prediction is None:
+            _online_prediction = Online_Prediction()
+
+        return _online_prediction
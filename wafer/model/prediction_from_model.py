@@ -1,9 +1,10 @@
 import pandas as pd
 from utils.logger import App_Logger
 from utils.read_params import read_params
-from wafer.blob_storage_operations.blob_operations import Blob_Operation
+from wafer.blob_storage_operations.storage_operations import get_storage_operation
 from wafer.data_ingestion.data_loader_prediction import Data_Getter_Pred
-from wafer.data_preprocessing.preprocessing import Preprocessor
+from wafer.model.cluster_router import Cluster_Router
+from wafer.model.model_registry import get_model_registry
 
 
 class Prediction:
@@ -31,23 +32,23 @@ class Prediction:
 
         self.log_writer = App_Logger()
 
-        self.blob = Blob_Operation()
+        self.blob = get_storage_operation()
 
         self.data_getter_pred = Data_Getter_Pred(table_name=self.pred_log)
 
-        self.preprocessor = Preprocessor(table_name=self.pred_log)
+        self.model_registry = get_model_registry()
 
         self.class_name = self.__class__.__name__
 
-    def delete_pred_file(self):
+    def predict_from_model(self):
         """
-        Method Name :   delete_pred_file
-        Description :   This method is used for deleting the existing prediction batch file
+        Method Name :   predict_from_model
+        Description :   This method is used for getting the prod models from the model registry and use them for prediction
 
         Version     :   1.2
         Revisions   :   moved setup to cloud
         """
-        method_name = self.delete_pred_file.__name__
+        method_name = self.predict_from_model.__name__
 
         self.log_writer.start_log(
             key="start",
@@ -58,194 +59,40 @@ class Prediction:
         )
 
         try:
-            f = self.blob.load_file(
-                file_name=self.pred_output_file,
-                container_name=self.input_files_container,
-                db_name=self.db_name,
-                collection_name=self.pred_log,
+            model_set = self.model_registry.get_model_set(
+                db_name=self.db_name, collection_name=self.pred_log
             )
 
-            if f is True:
-                self.log_writer.log(
-                    db_name=self.db_name,
-                    collection_name=self.pred_log,
-                    log_info="Found existing prediction batch file. Deleting it.",
-                )
-
-                self.blob.delete_file(
-                    file_name=self.pred_output_file,
-                    container_name=self.input_files_container,
-                    db_name=self.db_name,
-                    collection_name=self.pred_log,
-                )
-
-            else:
-                self.log_writer.log(
-                    db_name=self.db_name,
-                    collection_name=self.pred_log,
-                    log_info="Previous prediction file is not found, not deleting it",
-                )
-
-            self.log_writer.start_log(
-                key="exit",
-                class_name=self.class_name,
-                method_name=method_name,
-                db_name=self.db_name,
-                collection_name=self.pred_log,
+            data = self.data_getter_pred.get_data(
+                columns=["Wafer"] + model_set["preprocessing"].columns
             )
-        except Exception as e:
-            self.log_writer.exception_log(
-                error=e,
-                class_name=self.class_name,
-                method_name=method_name,
-                db_name=self.db_name,
-                collection_name=self.pred_log,
-            )
-
-    def find_correct_model_file(self, cluster_number, container_name):
-        """
-        Method Name :   find_correct_model_file
-        Description :   This method is used for finding the correct model file during prediction
 
-        Version     :   1.2
-        Revisions   :   moved setup to cloud
-        """
-        method_name = self.find_correct_model_file.__name__
-
-        self.log_writer.start_log(
-            key="start",
-            class_name=self.class_name,
-            method_name=method_name,
-            db_name=self.db_name,
-            collection_name=self.pred_log,
-        )
+            features = model_set["preprocessing"].transform(data)
 
-        try:
-            list_of_files = self.blob.get_files_from_folder(
-                folder_name=self.prod_model_dir,
-                container_name=container_name,
-                db_name=self.db_name,
-                collection_name=self.pred_log,
+            router = Cluster_Router(
+                kmeans=model_set["kmeans"], models=model_set["models"]
             )
 
-            for file in list_of_files:
-                try:
-                    if file.index(str(cluster_number)) != -1:
-                        model_name = file
-
-                except:
-                    continue
+            clusters, predictions = router.predict(features)
 
-            model_name = model_name.split(".")[0]
-
-            self.log_writer.log(
-                db_name=self.db_name,
-                collection_name=self.pred_log,
-                log_info=f"Got {model_name} from {self.prod_model_dir} folder in {container_name} container",
-            )
-
-            self.log_writer.start_log(
-                key="exit",
-                class_name=self.class_name,
-                method_name=method_name,
-                db_name=self.db_name,
-                collection_name=self.pred_log,
+            result = pd.DataFrame(
+                {"Wafer": data["Wafer"].to_numpy(), "Prediction": predictions}
             )
 
-            return model_name
-
-        except Exception as e:
-            self.log_writer.exception_log(
-                error=e,
-                class_name=self.class_name,
-                method_name=method_name,
+            self.log_writer.log(
                 db_name=self.db_name,
                 collection_name=self.pred_log,
+                log_info=f"Predicted {len(result)} rows over {len(set(clusters.tolist()))} clusters",
             )
 
-    def predict_from_model(self):
-        """
-        Method Name :   predict_from_model
-        Description :   This method is used for loading from prod model dir of blob container and use them for prediction
-
-        Version     :   1.2
-        Revisions   :   moved setup to cloud
-        """
-        method_name = self.predict_from_model.__name__
-
-        self.log_writer.start_log(
-            key="start",
-            class_name=self.class_name,
-            method_name=method_name,
-            db_name=self.db_name,
-            collection_name=self.pred_log,
-        )
-
-        try:
-            self.delete_pred_file()
-
-            data = self.data_getter_pred.get_data()
-
-            is_null_present = self.preprocessor.is_null_present(data)
-
-            if is_null_present:
-                data = self.preprocessor.impute_missing_values(data)
-
-            cols_to_drop = self.preprocessor.get_columns_with_zero_std_deviation(data)
-
-            data = self.preprocessor.remove_columns(data, cols_to_drop)
-
-            kmeans = self.blob.load_model(
-                model_name="KMeans",
-                container_name=self.model_container,
-                model_dir=self.prod_model_dir,
+            self.blob.upload_df_as_csv(
+                dataframe=result,
+                container_file_name=self.pred_output_file,
+                container_name=self.input_files_container,
                 db_name=self.db_name,
                 collection_name=self.pred_log,
             )
 
-            clusters = kmeans.predict(data.drop(["Wafer"], axis=1))
-
-            data["clusters"] = clusters
-
-            clusters = data["clusters"].unique()
-
-            for i in clusters:
-                cluster_data = data[data["clusters"] == i]
-
-                wafer_names = list(cluster_data["Wafer"])
-
-                cluster_data = data.drop(labels=["Wafer"], axis=1)
-
-                cluster_data = cluster_data.drop(["clusters"], axis=1)
-
-                crt_model_name = self.find_correct_model_file(
-                    cluster_number=i,
-                    container_name=self.model_container,
-                )
-
-                model = self.blob.load_model(
-                    model_name=crt_model_name,
-                    container_name=self.model_container,
-                    model_dir=self.prod_model_dir,
-                    db_name=self.db_name,
-                    collection_name=self.pred_log,
-                )
-
-                result = list(model.predict(cluster_data))
-
-                result = pd.DataFrame(
-                    list(zip(wafer_names, result)), columns=["Wafer", "Prediction"]
-                )
-
-                self.blob.upload_df_as_csv(
-                    dataframe=result,
-                    local_file_name=self.pred_output_file,
-                    container_file_name=self.pred_output_file,
-                    container_name=self.input_files_container,
-                    db_name=self.db_name,
-                    collection_name=self.pred_log,
-                )
-
             self.log_writer.log(
                 db_name=self.db_name,
                 collection_name=self.pred_log,
@@ -1,8 +1,9 @@
 import mlflow
-from wafer.blob_storage_operations.blob_operations import Blob_Operation
+from wafer.blob_storage_operations.storage_operations import get_storage_operation
 from wafer.data_ingestion.data_loader_train import Data_Getter_Train
 from wafer.data_preprocessing.clustering import KMeans_Clustering
 from wafer.data_preprocessing.preprocessing import Preprocessor
+from wafer.data_preprocessing.preprocessing_pipeline import Preprocessing_Pipeline
 from wafer.mlflow_utils.mlflow_operations import MLFlow_Operation
 from wafer.model_finder.tuner import Model_Finder
 from sklearn.model_selection import train_test_split
@@ -66,7 +67,7 @@ class Train_Model:
             db_name=self.db_name, collection_name=self.model_train_log
         )
 
-        self.blob = Blob_Operation()
+        self.blob = get_storage_operation()
 
     def training_model(self):
         """
@@ -98,11 +99,25 @@ class Train_Model:
 
             is_null_present = self.preprocessor.is_null_present(X)
 
+            imputer = self.preprocessor.fit_imputer(X)
+
             if is_null_present:
-                X = self.preprocessor.impute_missing_values(X)
+                X = self.preprocessor.impute_missing_values(X, imputer=imputer)
 
             cols_to_drop = self.preprocessor.get_columns_with_zero_std_deviation(X)
 
+            preprocessing = Preprocessing_Pipeline(
+                columns=X.columns, dropped_columns=cols_to_drop, imputer=imputer
+            )
+
+            self.blob.save_model(
+                model=preprocessing,
+                model_dir=self.train_model_dir,
+                container_name=self.model_container,
+                db_name=self.db_name,
+                collection_name=self.model_train_log,
+            )
+
             X = self.preprocessor.remove_columns(X, cols_to_drop)
 
             number_of_clusters = self.kmeans_op.elbow_plot(X)
@@ -0,0 +1,134 @@
+import threading
+
+from pymongo import MongoClient, monitoring
+
+
+class Pool_Listener(monitoring.ConnectionPoolListener):
+    """
+    Description :   This class is used for counting the connection pools and sockets opened by the
+                    shared mongodb clients
+
+    Version     :   1.2
+    Revisions   :   moved to setup to cloud
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+
+        self.pools_open = 0
+
+        self.connections_open = 0
+
+        self.connections_in_use = 0
+
+    def update(self, attr, value):
+        with self.lock:
+            setattr(self, attr, getattr(self, attr) + value)
+
+    def pool_created(self, event):
+        self.update("pools_open", 1)
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        self.update("pools_open", -1)
+
+    def connection_created(self, event):
+        self.update("connections_open", 1)
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        self.update("connections_open", -1)
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_check_out_failed(self, event):
+        pass
+
+    def connection_checked_out(self, event):
+        self.update("connections_in_use", 1)
+
+    def connection_checked_in(self, event):
+        self.update("connections_in_use", -1)
+
+
+class Mongo_Client_Registry:
+    """
+    Description :   This class is used for sharing one lazily created MongoClient per url across
+                    all the MongoDB_Operation instances of the process
+
+    Version     :   1.2
+    Revisions   :   moved to setup to cloud
+    """
+
+    def __init__(self):
+        self.clients = {}
+
+        self.lock = threading.Lock()
+
+        self.listener = Pool_Listener()
+
+    def get_client(self, db_url, pool_config):
+        """
+        Method Name :   get_client
+        Description :   This method is used for getting the shared client for the url, the client is
+                        created with the pool settings from params.yaml on first use
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        with self.lock:
+            if db_url not in self.clients:
+                self.clients[db_url] = MongoClient(
+                    db_url,
+                    maxPoolSize=pool_config["max_pool_size"],
+                    minPoolSize=pool_config["min_pool_size"],
+                    maxIdleTimeMS=pool_config["max_idle_time_ms"],
+                    connectTimeoutMS=pool_config["connect_timeout_ms"],
+                    serverSelectionTimeoutMS=pool_config["server_selection_timeout_ms"],
+                    waitQueueTimeoutMS=pool_config["wait_queue_timeout_ms"],
+                    event_listeners=[self.listener],
+                )
+
+            return self.clients[db_url]
+
+    def get_pool_stats(self):
+        """
+        Method Name :   get_pool_stats
+        Description :   This method is used for getting the number of clients, pools and sockets
+                        which are currently open
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        with self.listener.lock:
+            return {
+                "clients": len(self.clients),
+                "pools_open": self.listener.pools_open,
+                "connections_open": self.listener.connections_open,
+                "connections_in_use": self.listener.connections_in_use,
+            }
+
+    def close_all(self):
+        """
+        Method Name :   close_all
+        Description :   This method is used for closing all the shared clients
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        with self.lock:
+            for client in self.clients.values():
+                client.close()
+
+            self.clients = {}
+
+
+mongo_client_registry = Mongo_Client_Registry()
@@ -1,9 +1,11 @@
-import json
 import os
+from itertools import islice
 
 import pandas as pd
-from pymongo import MongoClient
+from pymongo import ReplaceOne
+from pymongo.errors import OperationFailure
 from utils.read_params import read_params
+from wafer.mongo_db_operations.mongo_client import mongo_client_registry
 
 
 class MongoDB_Operation:
@@ -21,7 +23,13 @@ class MongoDB_Operation:
 
         self.DB_URL = os.environ["MONGODB_URL"]
 
-        self.client = MongoClient(self.DB_URL)
+        self.client = mongo_client_registry.get_client(
+            db_url=self.DB_URL, pool_config=self.config["mongodb"]["pool"]
+        )
+
+        self.insert_batch_size = self.config["mongodb"]["insert"]["batch_size"]
+
+        self.export_batch_size = self.config["mongodb"]["export"]["batch_size"]
 
     def get_database(self, db_name):
         """
@@ -55,11 +63,117 @@ class MongoDB_Operation:
         except Exception as e:
             raise e
 
+    def iter_collection_as_dataframes(self, db_name, collection_name, batch_size=None):
+        """
+        Method Name :   iter_collection_as_dataframes
+        Description :   This method is used for reading the selected collection as dataframes of batch_size records,
+                        the cursor is read in batches with _id excluded on the server, so that only one batch of
+                        records is held in memory at a time
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        try:
+            batch_size = batch_size or self.export_batch_size
+
+            database = self.get_database(db_name)
+
+            collection = self.get_collection(
+                collection_name=collection_name, database=database
+            )
+
+            cursor = collection.find({}, {"_id": 0}, batch_size=batch_size)
+
+            while True:
+                records = list(islice(cursor, batch_size))
+
+                if len(records) == 0:
+                    break
+
+                yield pd.DataFrame.from_records(records)
+
+        except Exception as e:
+            raise e
+
     def get_collection_as_dataframe(self, db_name, collection_name):
         """
         Method Name :   get_collection_as_dataframe
         Description :   This method is used for converting the selected collection to dataframe
 
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        try:
+            dfs = list(
+                self.iter_collection_as_dataframes(
+                    db_name=db_name, collection_name=collection_name
+                )
+            )
+
+            func = (
+                lambda: pd.concat(dfs, ignore_index=True)
+                if len(dfs) > 0
+                else pd.DataFrame()
+            )
+
+            return func()
+
+        except Exception as e:
+            raise e
+
+    def get_records_from_dataframe(self, data_frame):
+        """
+        Method Name :   get_records_from_dataframe
+        Description :   This method is used for converting the dataframe to a list of bson ready dicts, the values are
+                        boxed to python types column wise and missing values are stored as None
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        values = data_frame.astype(object).where(data_frame.notna(), None)
+
+        columns = [str(col) for col in data_frame.columns]
+
+        return [dict(zip(columns, row)) for row in values.to_numpy().tolist()]
+
+    def insert_dataframe_as_record(
+        self, data_frame, db_name, collection_name, batch_size=None
+    ):
+        """
+        Method Name :   insert_dataframe_as_record
+        Description :   This method is used for inserting the dataframe in collection as record, the records
+                        are inserted with unordered insert_many in batches of mongodb.insert.batch_size
+        Output      :   Number of inserted records
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        try:
+            records = self.get_records_from_dataframe(data_frame)
+
+            batch_size = batch_size or self.insert_batch_size
+
+            database = self.get_database(db_name)
+
+            collection = self.get_collection(
+                collection_name=collection_name, database=database
+            )
+
+            for i in range(0, len(records), batch_size):
+                collection.insert_many(records[i : i + batch_size], ordered=False)
+
+            return len(records)
+
+        except Exception as e:
+            raise e
+
+    def create_unique_index(self, db_name, collection_name, keys):
+        """
+        Method Name :   create_unique_index
+        Description :   This method is used for creating a unique index on the keys of the collection, if the index
+                        already exists nothing is done
+        Output      :   True if the index exists, False if it could not be created because of duplicate records
+
         Version     :   1.2
         Revisions   :   moved setup to cloud
         """
@@ -70,34 +184,88 @@ class MongoDB_Operation:
                 collection_name=collection_name, database=database
             )
 
-            df = pd.DataFrame(list(collection.find()))
+            collection.create_index([(key, 1) for key in keys], unique=True)
 
-            if "_id" in df.columns.to_list():
-                df = df.drop(columns=["_id"], axis=1)
+            return True
 
-            return df
+        except OperationFailure:
+            return False
 
         except Exception as e:
             raise e
 
-    def insert_dataframe_as_record(self, data_frame, db_name, collection_name):
+    def upsert_dataframe_as_record(
+        self, data_frame, db_name, collection_name, key, batch_size=None
+    ):
         """
-        Method Name :   insert_dataframe_as_record
-        Description :   This method is used for inserting the dataframe in collection as record
+        Method Name :   upsert_dataframe_as_record
+        Description :   This method is used for upserting the dataframe in collection as record keyed on the key column,
+                        so that loading the same rows again replaces them instead of adding duplicates
+        Output      :   Number of upserted records
 
         Version     :   1.2
         Revisions   :   moved setup to cloud
         """
         try:
-            records = json.loads(data_frame.T.to_json()).values()
+            records = self.get_records_from_dataframe(data_frame)
+
+            batch_size = batch_size or self.insert_batch_size
+
+            database = self.get_database(db_name)
+
+            collection = self.get_collection(
+                collection_name=collection_name, database=database
+            )
+
+            for i in range(0, len(records), batch_size):
+                ops = [
+                    ReplaceOne({key: record[key]}, record, upsert=True)
+                    for record in records[i : i + batch_size]
+                ]
+
+                collection.bulk_write(ops, ordered=False)
+
+            return len(records)
+
+        except Exception as e:
+            raise e
+
+    def get_records(self, db_name, collection_name, query, projection=None):
+        """
+        Method Name :   get_records
+        Description :   This method is used for getting the records of the collection which match the query
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        try:
+            database = self.get_database(db_name)
+
+            collection = self.get_collection(
+                collection_name=collection_name, database=database
+            )
+
+            return list(collection.find(query, projection))
 
+        except Exception as e:
+            raise e
+
+    def upsert_record(self, db_name, collection_name, query, data):
+        """
+        Method Name :   upsert_record
+        Description :   This method is used for replacing the record which matches the query, or inserting it
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        try:
             database = self.get_database(db_name)
 
             collection = self.get_collection(
                 collection_name=collection_name, database=database
             )
 
-            collection.insert_many(records)
+            collection.replace_one(query, data, upsert=True)
 
         except Exception as e:
             raise e
@@ -121,3 +289,23 @@ class MongoDB_Operation:
 
         except Exception as e:
             raise e
+
+    def insert_records(self, db_name, collection_name, data):
+        """
+        Method Name :   insert_records
+        Description :   This method is used for inserting multiple records in database collection in a single request
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        try:
+            db = self.get_database(db_name=db_name)
+
+            collection = self.get_collection(
+                collection_name=collection_name, database=db
+            )
+
+            collection.insert_many(data, ordered=False)
+
+        except Exception as e:
+            raise e
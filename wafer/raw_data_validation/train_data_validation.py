@@ -2,7 +2,7 @@ import re
 
 from utils.logger import App_Logger
 from utils.read_params import read_params
-from wafer.blob_storage_operations.blob_operations import Blob_Operation
+from wafer.blob_storage_operations.storage_operations import get_storage_operation
 
 
 class Raw_Train_Data_Validation:
@@ -24,7 +24,7 @@ class Raw_Train_Data_Validation:
 
         self.class_name = self.__class__.__name__
 
-        self.blob = Blob_Operation()
+        self.blob = get_storage_operation()
 
         self.train_data_container = self.config["container"]["train_data"]
 
@@ -176,6 +176,40 @@ class Raw_Train_Data_Validation:
                 collection_name=self.train_gen_log,
             )
 
+    def is_valid_file_name(
+        self, filename, regex, LengthOfDateStampInFile, LengthOfTimeStampInFile
+    ):
+        """
+        Method Name :   is_valid_file_name
+        Description :   This method is used for checking a single raw file name against the regex pattern
+                        and the date and time stamp lengths from the schema
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        if not re.match(regex, filename):
+            return False
+
+        splitAtDot = re.split(".csv", filename)
+
+        splitAtDot = re.split("_", splitAtDot[0])
+
+        return (
+            len(splitAtDot[1]) == LengthOfDateStampInFile
+            and len(splitAtDot[2]) == LengthOfTimeStampInFile
+        )
+
+    def get_all_null_columns(self, df):
+        """
+        Method Name :   get_all_null_columns
+        Description :   This method is used for getting the columns of the dataframe which have only missing values,
+                        checked over the whole frame at once
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        return df.columns[df.isna().all().to_numpy()].tolist()
+
     def validate_raw_file_name(
         self, regex, LengthOfDateStampInFile, LengthOfTimeStampInFile
     ):
@@ -212,65 +246,51 @@ class Raw_Train_Data_Validation:
                 log_info="Got training files with exact name",
             )
 
+            good_pairs, bad_pairs = [], []
+
             for filename in train_batch_files:
                 raw_data_train_filename = self.raw_train_data_dir + "/" + filename
 
-                good_data_train_filename = self.good_train_data_dir + "/" + filename
-
-                bad_data_train_filename = self.bad_train_data_dir + "/" + filename
-
-                self.log_writer.log(
-                    db_name=self.db_name,
-                    collection_name=self.train_name_valid_log,
-                    log_info="Created raw,good and bad data filenames",
-                )
-
-                if re.match(regex, filename):
-                    splitAtDot = re.split(".csv", filename)
-
-                    splitAtDot = re.split("_", splitAtDot[0])
-
-                    if len(splitAtDot[1]) == LengthOfDateStampInFile:
-                        if len(splitAtDot[2]) == LengthOfTimeStampInFile:
-                            self.blob.copy_data(
-                                from_file_name=raw_data_train_filename,
-                                from_container_name=self.raw_data_container_name,
-                                to_file_name=good_data_train_filename,
-                                to_container_name=self.train_data_container,
-                                db_name=self.db_name,
-                                collection_name=self.train_name_valid_log,
-                            )
-
-                        else:
-                            self.blob.copy_data(
-                                from_file_name=raw_data_train_filename,
-                                from_container_name=self.raw_data_container_name,
-                                to_file_name=bad_data_train_filename,
-                                to_container_name=self.train_data_container,
-                                db_name=self.db_name,
-                                collection_name=self.train_name_valid_log,
-                            )
-
-                    else:
-                        self.blob.copy_data(
-                            from_file_name=raw_data_train_filename,
-                            from_container_name=self.raw_data_container_name,
-                            to_file_name=bad_data_train_filename,
-                            to_container_name=self.train_data_container,
-                            db_name=self.db_name,
-                            collection_name=self.train_name_valid_log,
+                if self.is_valid_file_name(
+                    filename=filename,
+                    regex=regex,
+                    LengthOfDateStampInFile=LengthOfDateStampInFile,
+                    LengthOfTimeStampInFile=LengthOfTimeStampInFile,
+                ):
+                    good_pairs.append(
+                        (
+                            raw_data_train_filename,
+                            self.good_train_data_dir + "/" + filename,
                         )
+                    )
 
                 else:
-                    self.blob.copy_data(
-                        from_file_name=raw_data_train_filename,
-                        from_container_name=self.raw_data_container_name,
-                        to_file_name=bad_data_train_filename,
-                        to_container_name=self.train_data_container,
-                        db_name=self.db_name,
-                        collection_name=self.train_name_valid_log,
+                    bad_pairs.append(
+                        (
+                            raw_data_train_filename,
+                            self.bad_train_data_dir + "/" + filename,
+                        )
                     )
 
+            self.log_writer.log(
+                db_name=self.db_name,
+                collection_name=self.train_name_valid_log,
+                log_info=f"Got {len(good_pairs)} good and {len(bad_pairs)} bad files based on file name",
+            )
+
+            reports = self.blob.copy_files(
+                file_pairs=good_pairs + bad_pairs,
+                from_container_name=self.raw_data_container_name,
+                to_container_name=self.train_data_container,
+                db_name=self.db_name,
+                collection_name=self.train_name_valid_log,
+            )
+
+            failed = [r["from_file"] for r in reports if r["status"] != "success"]
+
+            if len(failed) > 0:
+                raise Exception(f"Failed to copy {failed} files")
+
             self.log_writer.start_log(
                 key="exit",
                 class_name=self.class_name,
@@ -291,7 +311,8 @@ class Raw_Train_Data_Validation:
     def validate_col_length(self, NumberofColumns):
         """
         Method Name :   validate_col_length
-        Description :   This method is used for validating the column length of the csv file
+        Description :   This method is used for validating the column length of the csv file, only the
+                        header of each file is fetched with a ranged download
 
         Version     :   1.2
         Revisions   :   moved setup to cloud
@@ -307,38 +328,40 @@ class Raw_Train_Data_Validation:
         )
 
         try:
-            lst = self.blob.read_csv_from_folder(
+            files = self.blob.get_files_from_folder(
                 folder_name=self.good_train_data_dir,
                 container_name=self.train_data_container,
                 db_name=self.db_name,
                 collection_name=self.train_col_valid_log,
             )
 
-            for f in lst:
-                df = f[0]
-
-                file = f[1]
+            csv_files = [f for f in files if f.endswith(".csv")]
 
-                abs_f = f[2]
+            headers = self.blob.read_csv_headers(
+                files=csv_files,
+                container_name=self.train_data_container,
+                db_name=self.db_name,
+                collection_name=self.train_col_valid_log,
+            )
 
-                if file.endswith(".csv"):
-                    if df.shape[1] == NumberofColumns:
-                        pass
+            bad_pairs = [
+                (file, self.bad_train_data_dir + "/" + file.split("/")[-1])
+                for file in csv_files
+                if len(headers[file]) != NumberofColumns
+            ]
 
-                    else:
-                        dest_f = self.bad_train_data_dir + "/" + abs_f
+            reports = self.blob.move_files(
+                file_pairs=bad_pairs,
+                from_container_name=self.train_data_container,
+                to_container_name=self.train_data_container,
+                db_name=self.db_name,
+                collection_name=self.train_col_valid_log,
+            )
 
-                        self.blob.move_data(
-                            from_file_name=file,
-                            from_container_name=self.train_data_container,
-                            to_file_name=dest_f,
-                            to_container_name=self.train_data_container,
-                            db_name=self.db_name,
-                            collection_name=self.train_col_valid_log,
-                        )
+            failed = [r["from_file"] for r in reports if r["status"] != "success"]
 
-                else:
-                    pass
+            if len(failed) > 0:
+                raise Exception(f"Failed to move {failed} files")
 
             self.log_writer.start_log(
                 key="exit",
@@ -360,7 +383,8 @@ class Raw_Train_Data_Validation:
     def validate_missing_values_in_col(self):
         """
         Method Name :   validate_missing_values_in_col
-        Description :   This method is used for validating the missing values in columns
+        Description :   This method is used for validating the missing values in columns, files with a column
+                        of only missing values are moved to bad data dir and the rest are left untouched
 
         Version     :   1.2
         Revisions   :   moved setup to cloud
@@ -376,48 +400,31 @@ class Raw_Train_Data_Validation:
         )
 
         try:
-            lst = self.blob.read_csv_from_folder(
+            lst = self.blob.iter_csv_from_folder(
                 folder_name=self.good_train_data_dir,
                 container_name=self.train_data_container,
                 db_name=self.db_name,
                 collection_name=self.train_missing_value_log,
             )
 
-            for f in lst:
-                df = f[0]
-
-                file = f[1]
-
-                abs_f = f[2]
-
+            for df, file, abs_f in lst:
                 if abs_f.endswith(".csv"):
-                    count = 0
-
-                    for cols in df:
-                        if (len(df[cols]) - df[cols].count()) == len(df[cols]):
-                            count += 1
+                    null_cols = self.get_all_null_columns(df)
 
-                            dest_f = self.bad_train_data_dir + "/" + abs_f
-
-                            self.blob.move_data(
-                                from_file_name=file,
-                                from_container_name=self.train_data_container,
-                                to_file_name=dest_f,
-                                to_container_name=self.train_data_container,
-                                db_name=self.db_name,
-                                collection_name=self.train_missing_value_log,
-                            )
-
-                            break
+                    if len(null_cols) > 0:
+                        self.log_writer.log(
+                            db_name=self.db_name,
+                            collection_name=self.train_missing_value_log,
+                            log_info=f"{file} file has columns with only missing values : {null_cols}, moving it to bad data dir",
+                        )
 
-                    if count == 0:
-                        dest_f = self.good_train_data_dir + "/" + abs_f
+                        dest_f = self.bad_train_data_dir + "/" + abs_f
 
-                        self.blob.upload_df_as_csv(
-                            dataframe=df,
-                            local_file_name=abs_f,
-                            container_file_name=dest_f,
-                            container_name=self.train_data_container,
+                        self.blob.move_data(
+                            from_file_name=file,
+                            from_container_name=self.train_data_container,
+                            to_file_name=dest_f,
+                            to_container_name=self.train_data_container,
                             db_name=self.db_name,
                             collection_name=self.train_missing_value_log,
                         )
@@ -425,13 +432,13 @@ class Raw_Train_Data_Validation:
                 else:
                     pass
 
-                self.log_writer.start_log(
-                    key="exit",
-                    class_name=self.class_name,
-                    method_name=method_name,
-                    db_name=self.db_name,
-                    collection_name=self.train_missing_value_log,
-                )
+            self.log_writer.start_log(
+                key="exit",
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=self.db_name,
+                collection_name=self.train_missing_value_log,
+            )
 
         except Exception as e:
             self.log_writer.exception_log(
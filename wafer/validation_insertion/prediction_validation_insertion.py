@@ -93,8 +93,8 @@ class Pred_Validation:
             )
 
             self.db_operation.insert_good_data_as_record(
-                db_name=self.good_data_db_name,
-                collection_name=self.good_data_collection_name,
+                good_data_db_name=self.good_data_db_name,
+                good_data_collection_name=self.good_data_collection_name,
             )
 
             self.log_writer.log(
@@ -104,8 +104,8 @@ class Pred_Validation:
             )
 
             self.db_operation.export_collection_to_csv(
-                db_name=self.good_data_db_name,
-                collection_name=self.good_data_collection_name,
+                good_data_db_name=self.good_data_db_name,
+                good_data_collection_name=self.good_data_collection_name,
             )
 
             self.log_writer.start_log(
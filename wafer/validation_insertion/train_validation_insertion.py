@@ -1,5 +1,6 @@
 from utils.logger import App_Logger
 from utils.read_params import read_params
+from wafer.blob_storage_operations.storage_operations import get_storage_operation
 from wafer.data_transform.data_transformation_train import Data_Transform_Train
 from wafer.data_type_valid.data_type_valid_train import DB_Operation_Train
 from wafer.raw_data_validation.train_data_validation import Raw_Train_Data_Validation
@@ -18,6 +19,8 @@ class Train_Validation:
             raw_data_container_name=container_name
         )
 
+        self.raw_data_container_name = container_name
+
         self.data_transform = Data_Transform_Train()
 
         self.db_operation = DB_Operation_Train()
@@ -34,8 +37,156 @@ class Train_Validation:
 
         self.good_data_collection_name = self.config["mongodb"]["train"]["collection"]
 
+        self.train_data_container = self.config["container"]["train_data"]
+
+        self.raw_train_data_dir = self.config["data"]["raw_data"]["train"]
+
+        self.good_train_data_dir = self.config["data"]["train"]["good"]
+
+        self.bad_train_data_dir = self.config["data"]["train"]["bad"]
+
+        self.blob = get_storage_operation()
+
         self.log_writer = App_Logger()
 
+    def validate_and_transform_files(
+        self, regex, LengthOfDateStampInFile, LengthOfTimeStampInFile, NumberofColumns
+    ):
+        """
+        Method Name :   validate_and_transform_files
+        Description :   This method downloads every raw training file once and applies the file name, column
+                        length and missing values checks along with the data transformation in memory. Only the
+                        final artifact is written, the transformed file to good data dir or the raw file to bad
+                        data dir. Column length is checked from the header alone, so such bad files are never
+                        downloaded in full
+
+        Version     :   1.2
+        Revisions   :   moved setup to cloud
+        """
+        method_name = self.validate_and_transform_files.__name__
+
+        self.log_writer.start_log(
+            key="start",
+            class_name=self.class_name,
+            method_name=method_name,
+            db_name=self.db_name,
+            collection_name=self.train_main_log,
+        )
+
+        try:
+            raw_files = self.blob.get_files_from_folder(
+                folder_name=self.raw_train_data_dir,
+                container_name=self.raw_data_container_name,
+                db_name=self.db_name,
+                collection_name=self.train_main_log,
+            )
+
+            valid_name_files, bad_files = [], []
+
+            for file in raw_files:
+                filename = file.split("/")[-1]
+
+                if self.raw_data.is_valid_file_name(
+                    filename=filename,
+                    regex=regex,
+                    LengthOfDateStampInFile=LengthOfDateStampInFile,
+                    LengthOfTimeStampInFile=LengthOfTimeStampInFile,
+                ):
+                    valid_name_files.append(file)
+
+                else:
+                    bad_files.append(file)
+
+            headers = self.blob.read_csv_headers(
+                files=valid_name_files,
+                container_name=self.raw_data_container_name,
+                db_name=self.db_name,
+                collection_name=self.train_main_log,
+            )
+
+            valid_col_files = []
+
+            for file in valid_name_files:
+                if len(headers[file]) == NumberofColumns:
+                    valid_col_files.append(file)
+
+                else:
+                    bad_files.append(file)
+
+            csv_files = self.blob.iter_csv_files(
+                files=valid_col_files,
+                container_name=self.raw_data_container_name,
+                db_name=self.db_name,
+                collection_name=self.train_main_log,
+            )
+
+            good_count = 0
+
+            for df, file, abs_f in csv_files:
+                null_cols = self.raw_data.get_all_null_columns(df)
+
+                if len(null_cols) > 0:
+                    self.log_writer.log(
+                        db_name=self.db_name,
+                        collection_name=self.train_main_log,
+                        log_info=f"{file} file has columns with only missing values : {null_cols}",
+                    )
+
+                    bad_files.append(file)
+
+                    continue
+
+                df = self.data_transform.transform_dataframe(df)
+
+                self.blob.upload_df_as_csv(
+                    dataframe=df,
+                    container_file_name=self.good_train_data_dir + "/" + abs_f,
+                    container_name=self.train_data_container,
+                    db_name=self.db_name,
+                    collection_name=self.train_main_log,
+                )
+
+                good_count += 1
+
+            reports = self.blob.copy_files(
+                file_pairs=[
+                    (file, self.bad_train_data_dir + "/" + file.split("/")[-1])
+                    for file in bad_files
+                ],
+                from_container_name=self.raw_data_container_name,
+                to_container_name=self.train_data_container,
+                db_name=self.db_name,
+                collection_name=self.train_main_log,
+            )
+
+            failed = [r["from_file"] for r in reports if r["status"] != "success"]
+
+            if len(failed) > 0:
+                raise Exception(f"Failed to copy {failed} files to bad data dir")
+
+            self.log_writer.log(
+                db_name=self.db_name,
+                collection_name=self.train_main_log,
+                log_info=f"Validated {len(raw_files)} raw files, {good_count} transformed files written to good data dir and {len(bad_files)} files copied to bad data dir",
+            )
+
+            self.log_writer.start_log(
+                key="exit",
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=self.db_name,
+                collection_name=self.train_main_log,
+            )
+
+        except Exception as e:
+            self.log_writer.exception_log(
+                error=e,
+                class_name=self.class_name,
+                method_name=method_name,
+                db_name=self.db_name,
+                collection_name=self.train_main_log,
+            )
+
     def training_validation(self):
         """
         Method Name :   training_validation
@@ -64,39 +215,22 @@ class Train_Validation:
 
             regex = self.raw_data.get_regex_pattern()
 
-            self.raw_data.validate_raw_file_name(
-                regex, LengthOfDateStampInFile, LengthOfTimeStampInFile
+            self.validate_and_transform_files(
+                regex=regex,
+                LengthOfDateStampInFile=LengthOfDateStampInFile,
+                LengthOfTimeStampInFile=LengthOfTimeStampInFile,
+                NumberofColumns=noofcolumns,
             )
 
-            self.raw_data.validate_col_length(NumberofColumns=noofcolumns)
-
-            self.raw_data.validate_missing_values_in_col()
-
-            self.log_writer.log(
-                db_name=self.db_name,
-                collection_name=self.train_main_log,
-                log_info="Raw Data Validation Completed !!",
-            )
-
-            self.log_writer.log(
-                db_name=self.db_name,
-                collection_name=self.train_main_log,
-                log_info="Starting Data Transformation",
-            )
-
-            self.data_transform.rename_target_column()
-
-            self.data_transform.replace_missing_with_null()
-
             self.log_writer.log(
                 db_name=self.db_name,
                 collection_name=self.train_main_log,
-                log_info="Data Transformation completed !!",
+                log_info="Raw Data Validation and Data Transformation completed !!",
             )
 
             self.db_operation.insert_good_data_as_record(
-                db_name=self.good_data_db_name,
-                collection_name=self.good_data_collection_name,
+                good_data_db_name=self.good_data_db_name,
+                good_data_collection_name=self.good_data_collection_name,
             )
 
             self.log_writer.log(
@@ -106,8 +240,8 @@ class Train_Validation:
             )
 
             self.db_operation.export_collection_to_csv(
-                db_name=self.good_data_db_name,
-                collection_name=self.good_data_collection_name,
+                good_data_db_name=self.good_data_db_name,
+                good_data_collection_name=self.good_data_collection_name,
             )
 
             self.log_writer.start_log(